@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from homeassistant.const import CONF_HOST, CONF_MAC, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
-from .const import CONF_PIN_CODE
+from .const import (
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_HEARTBEAT_MISSES,
+    CONF_PIN_CODE,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_MISSES,
+)
+from .cache import FactCache
 from .coordinator import BarcoCoordinator
 from .device import BarcoDevice
+from .filters import sensor_filter_options
+from .hub import async_get_hub, async_release_hub
+from .properties import FILTERED_SENSORS
 
 _PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -22,25 +33,59 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Barco device from a config entry."""
+    """Set up Barco device from a config entry.
 
+    Nothing here waits on the projector: entities are added with cached or
+    unknown state and the handshake runs in the background, so an offline
+    projector does not hold up startup.
+    """
+
+    start = time.monotonic()
     host = entry.options.get(CONF_HOST, entry.data.get(CONF_HOST))
     mac = entry.options.get(CONF_MAC, entry.data.get(CONF_MAC))
     pin_code = entry.options.get(CONF_PIN_CODE, entry.data.get(CONF_PIN_CODE))
+    hub = async_get_hub(hass)
     dev = BarcoDevice(
         hass,
+        hub,
         host,
         mac,
         pin_code,
     )
-    coord = BarcoCoordinator(hass, entry, dev)
+    for sensor, key in FILTERED_SENSORS.items():
+        dev.set_filter_options(*sensor_filter_options(entry.options, sensor), keys=(key,))
+    dev.set_heartbeat_options(
+        entry.options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+        entry.options.get(CONF_HEARTBEAT_MISSES, DEFAULT_HEARTBEAT_MISSES),
+    )
+    # Entities come up with the last known model and sources, rather than
+    # waiting for the projector to leave eco
+    cache = FactCache(hass, entry.entry_id, mac)
+    dev.restore_facts(await cache.async_load())
+    hub.register(dev)
+    entry.async_on_unload(lambda: async_release_hub(hass, dev))
+    coord = BarcoCoordinator(hass, entry, dev, cache)
     entry.runtime_data = coord
     await coord.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    dev.stats.setup_time = (time.monotonic() - start) * 1000
+    _LOGGER.debug("Set up %s in %.1f ms", dev.device_id, dev.stats.setup_time)
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when the options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached device facts."""
+    mac = entry.options.get(CONF_MAC, entry.data.get(CONF_MAC))
+    await FactCache(hass, entry.entry_id, mac).async_remove()
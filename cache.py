@@ -0,0 +1,75 @@
+"""Persistent cache of static Barco Pulse device facts."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .properties import STATIC_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the cached facts change shape; older caches are then dropped
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN.lower()}_facts"
+SAVE_DELAY = 10
+
+
+class _FactStore(Store[dict[str, Any]]):
+    """Store that drops caches written by another version."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Start over rather than migrate, the facts are read again on connect."""
+        _LOGGER.debug("Dropping fact cache version %s", old_major_version)
+        return {}
+
+
+class FactCache:
+    """Model, serial number, firmware and source list, kept across restarts.
+
+    The cache is stamped with the projector's MAC address, so facts
+    cached for another projector are never applied to this one.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, mac: str) -> None:
+        """Set up cache."""
+        self._store = _FactStore(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._mac = mac.lower()
+        self._facts: dict[str, Any] = {}
+
+    @property
+    def facts(self) -> dict[str, Any]:
+        """Return the cached facts."""
+        return self._facts
+
+    async def async_load(self) -> dict[str, Any]:
+        """Read the cached facts, dropping any that do not apply."""
+        data = await self._store.async_load() or {}
+        if data.get("mac") != self._mac:
+            if data:
+                _LOGGER.debug("Ignoring facts cached for %s", data.get("mac"))
+            data = {}
+        facts = data.get("facts", {})
+        self._facts = {key: facts[key] for key in STATIC_KEYS if key in facts}
+        return self._facts
+
+    @callback
+    def async_update(self, facts: dict[str, Any]) -> bool:
+        """Cache new facts, returning True if they differ from what was cached."""
+        if facts == self._facts:
+            return False
+        self._facts = dict(facts)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return True
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"mac": self._mac, "facts": self._facts}
+
+    async def async_remove(self) -> None:
+        """Delete the cache."""
+        await self._store.async_remove()
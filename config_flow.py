@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+import ipaddress
 import logging
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow, ConfigEntry
+from homeassistant.components import network
+from homeassistant.config_entries import (
+    SOURCE_IMPORT,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+    ConfigEntry,
+)
 from homeassistant.const import CONF_HOST, CONF_MAC
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import section
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.device_registry import format_mac
 
-from .const import DOMAIN, CONF_PIN_CODE
-from .device import BarcoDevice
+from .const import (
+    BARCO_DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_HEARTBEAT_MISSES,
+    CONF_PIN_CODE,
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_HYSTERESIS,
+    CONF_TEMP_MIN_INTERVAL,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_MISSES,
+)
+from .discovery import DiscoveredProjector, async_discover, async_probe
+from .filters import FILTER_OPTIONS, sensor_filter_options
+from .properties import FILTERED_SENSORS
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_SUBNETS = "subnets"
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -25,28 +52,73 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+FILTER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEMP_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Required(CONF_TEMP_HYSTERESIS): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Required(CONF_TEMP_MIN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
 OPTIONS_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_MAC): str,
-        vol.Required(CONF_PIN_CODE): str
+        vol.Required(CONF_PIN_CODE): str,
+        # One collapsed section of filter settings per sensor
+        **{
+            vol.Required(sensor): section(FILTER_DATA_SCHEMA, {"collapsed": True})
+            for sensor in FILTERED_SENSORS
+        },
+        vol.Required(CONF_HEARTBEAT_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(CONF_HEARTBEAT_MISSES): vol.All(vol.Coerce(int), vol.Range(min=1)),
     }
 )
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+    """Validate the user input allows us to connect.
+
+    Probed over a connection of its own, so an aborted flow leaves
+    nothing behind.
+    """
+
+    # The device accepts aa:bb:cc:dd:ee:ff or aabb.ccdd.eeff
+    if len(data.get(CONF_MAC, "")) not in (14, 17):
+        raise InvalidMac
+    pin_code = data.get(CONF_PIN_CODE, "")
+    if not pin_code.isdigit():
+        raise InvalidAuth
+    unit = await async_probe(data.get(CONF_HOST), pin_code)
+    if unit is None:
+        raise CannotConnect
+    if not unit.authenticated:
+        raise InvalidAuth
+    return {"title": _title(unit)}
+
+
+async def async_local_subnets(hass: HomeAssistant) -> list[str]:
+    """Return the IPv4 networks of the enabled network adapters, up to the scan limit.
+
+    Networks too large to scan, such as a /16 container bridge, are left out
+    rather than making the default fail, as are any past the limit in all.
+    """
+    subnets = []
+    total = 0
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for addr in adapter["ipv4"]:
+            net = ipaddress.ip_network(f"{addr['address']}/{addr['network_prefix']}", strict=False)
+            if total + net.num_addresses > BARCO_DISCOVERY_MAX_HOSTS:
+                _LOGGER.debug("Not scanning %s on %s by default", net, adapter["name"])
+                continue
+            subnets.append(str(net))
+            total += net.num_addresses
+    return subnets
 
-    dev = BarcoDevice(
-        hass,
-        data.get(CONF_HOST),
-        data.get(CONF_MAC),
-        data.get(CONF_PIN_CODE)
-    )
-    await dev.test_connection()
-    if dev.connection_tested:
-        return {"title": "Projector"}
 
-    raise CannotConnect
+def _title(unit: DiscoveredProjector) -> str:
+    return f"{unit.model} ({unit.host})"
 
 
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -54,6 +126,11 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Set up flow."""
+        self._discovered: dict[str, DiscoveredProjector] = {}
+        self._pin_code: str | None = None
+
     @staticmethod
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Create the options flow."""
@@ -62,7 +139,13 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step."""
+        """Offer to scan the network or to enter a projector by hand."""
+        return self.async_show_menu(step_id="user", menu_options=["discover", "manual"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle a projector entered by hand."""
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
@@ -71,6 +154,8 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
+            except InvalidMac:
+                errors[CONF_MAC] = "invalid_mac"
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -78,7 +163,141 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan subnets for projectors that accept the PIN."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            subnets = [s for s in user_input[CONF_SUBNETS].split(",") if s.strip()]
+            pin_code = user_input[CONF_PIN_CODE]
+            if not pin_code.isdigit():
+                errors[CONF_PIN_CODE] = "invalid_auth"
+            else:
+                try:
+                    found = await async_discover(self.hass, subnets, pin_code)
+                except ValueError as err:
+                    _LOGGER.debug("Cannot scan %s: %s", subnets, err)
+                    errors[CONF_SUBNETS] = "invalid_subnet"
+                else:
+                    self._pin_code = pin_code
+                    self._discovered = self._new_projectors(found)
+                    if self._discovered:
+                        return await self.async_step_pick()
+                    if any(unit.authenticated is False for unit in found):
+                        errors["base"] = "invalid_auth"
+                    else:
+                        errors["base"] = "no_devices_found"
+
+        subnets = ", ".join(await async_local_subnets(self.hass))
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_SUBNETS, default=subnets): str,
+                vol.Required(CONF_PIN_CODE): str,
+            }
+        )
+        return self.async_show_form(step_id="discover", data_schema=schema, errors=errors)
+
+    def _new_projectors(
+        self, found: list[DiscoveredProjector]
+    ) -> dict[str, DiscoveredProjector]:
+        """Keep the projectors that can be added and are not set up already."""
+        configured = set()
+        for entry in self._async_current_entries(include_ignore=False):
+            configured.add(entry.options.get(CONF_HOST, entry.data.get(CONF_HOST)))
+            mac = entry.options.get(CONF_MAC, entry.data.get(CONF_MAC))
+            if mac:
+                configured.add(format_mac(mac))
+        new = {}
+        for unit in found:
+            if not unit.authenticated or unit.mac is None:
+                _LOGGER.info(
+                    "Skipping %s at %s: %s",
+                    unit.model,
+                    unit.host,
+                    "PIN rejected" if not unit.authenticated else "MAC address unknown",
+                )
+            elif unit.host not in configured and format_mac(unit.mac) not in configured:
+                new[unit.host] = unit
+        return new
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add the projectors picked from the scan."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            picked = [self._discovered[host] for host in user_input[CONF_HOST]]
+            if picked:
+                first, *rest = picked
+                # One entry per projector: this flow adds the first, the rest are imported
+                for unit in rest:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={
+                                "source": SOURCE_IMPORT,
+                                "title_placeholders": {"name": _title(unit)},
+                            },
+                            data=self._entry_data(unit),
+                        )
+                    )
+                await self.async_set_unique_id(format_mac(first.mac))
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(title=_title(first), data=self._entry_data(first))
+            errors["base"] = "no_devices_found"
+
+        units = {
+            host: f"{unit.model} {unit.serial} ({host})" for host, unit in self._discovered.items()
+        }
+        schema = vol.Schema({vol.Required(CONF_HOST, default=list(units)): cv.multi_select(units)})
+        return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Add a projector found by a scan in another flow."""
+        await self.async_set_unique_id(format_mac(import_data[CONF_MAC]))
+        self._abort_if_unique_id_configured()
+        title = self.context.get("title_placeholders", {}).get("name", "Projector")
+        return self.async_create_entry(title=title, data=import_data)
+
+    def _entry_data(self, unit: DiscoveredProjector) -> dict[str, Any]:
+        return {CONF_HOST: unit.host, CONF_MAC: unit.mac, CONF_PIN_CODE: self._pin_code}
+
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> ConfigFlowResult:
+        """Start when the projector rejects the PIN code."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Ask for the new PIN code and check it with the projector."""
+        errors: dict[str, str] = {}
+        entry = self._get_reauth_entry()
+        if user_input is not None:
+            pin_code = user_input[CONF_PIN_CODE]
+            host = entry.options.get(CONF_HOST, entry.data.get(CONF_HOST))
+            unit = await async_probe(host, pin_code) if pin_code.isdigit() else None
+            if not pin_code.isdigit() or (unit is not None and not unit.authenticated):
+                errors[CONF_PIN_CODE] = "invalid_auth"
+            elif unit is None:
+                errors["base"] = "cannot_connect"
+            else:
+                # The options flow may have stored the PIN code over the entry data
+                options = entry.options
+                if CONF_PIN_CODE in options:
+                    options = {**options, CONF_PIN_CODE: pin_code}
+                return self.async_update_reload_and_abort(
+                    entry, data_updates={CONF_PIN_CODE: pin_code}, options=options
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PIN_CODE): str}),
+            description_placeholders={"name": entry.title},
+            errors=errors,
         )
 
 class OptionsFlowHandler(OptionsFlow):
@@ -93,7 +312,16 @@ class OptionsFlowHandler(OptionsFlow):
         previous_data = {
             CONF_HOST: self.config_entry.options.get(CONF_HOST, self.config_entry.data.get(CONF_HOST)),
             CONF_MAC: self.config_entry.options.get(CONF_MAC, self.config_entry.data.get(CONF_MAC)),
-            CONF_PIN_CODE: self.config_entry.options.get(CONF_PIN_CODE, self.config_entry.data.get(CONF_PIN_CODE))
+            CONF_PIN_CODE: self.config_entry.options.get(CONF_PIN_CODE, self.config_entry.data.get(CONF_PIN_CODE)),
+            **{
+                sensor: dict(zip(
+                    (conf for conf, _ in FILTER_OPTIONS),
+                    sensor_filter_options(self.config_entry.options, sensor),
+                ))
+                for sensor in FILTERED_SENSORS
+            },
+            CONF_HEARTBEAT_INTERVAL: self.config_entry.options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+            CONF_HEARTBEAT_MISSES: self.config_entry.options.get(CONF_HEARTBEAT_MISSES, DEFAULT_HEARTBEAT_MISSES),
         }
         return self.async_show_form(
             step_id="init",
@@ -108,3 +336,7 @@ class CannotConnect(HomeAssistantError):
 
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
+
+
+class InvalidMac(HomeAssistantError):
+    """Error to indicate the MAC address is not in a known format."""
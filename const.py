@@ -5,8 +5,68 @@ MANUFACTURER = "Barco"
 EVENT = "barco_pulse_event"
 
 CONF_PIN_CODE = "pin_code"
+CONF_TEMP_DEADBAND = "temperature_deadband"
+CONF_TEMP_HYSTERESIS = "temperature_hysteresis"
+CONF_TEMP_MIN_INTERVAL = "temperature_min_interval"
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"
+CONF_HEARTBEAT_MISSES = "heartbeat_misses"
+
+# Temperature filtering defaults, in degrees Fahrenheit and seconds
+DEFAULT_TEMP_DEADBAND = 0.5
+DEFAULT_TEMP_HYSTERESIS = 0.5
+DEFAULT_TEMP_MIN_INTERVAL = 30
+
+# Seconds of silence before the link is checked (0 = off), and missed replies before it is dropped
+DEFAULT_HEARTBEAT_INTERVAL = 5
+DEFAULT_HEARTBEAT_MISSES = 2
 
 BARCO_CONNECT_TIMEOUT = 10
 BARCO_LOGIN_TIMEOUT = 10
+BARCO_REQUEST_TIMEOUT = 10
+# How long a macro waits for its property changes to be confirmed
+BARCO_MACRO_TIMEOUT = 10
+# How long an optimistic value is shown without the projector confirming it
+BARCO_OPTIMISTIC_TIMEOUT = 15
+BARCO_MAX_PENDING_REQUESTS = 64
 BARCO_PORT = 9090
+BARCO_READ_SIZE = 65536
 BARCO_MIN_COMMAND_INTERVAL = 1
+
+# TCP keepalive, in case the heartbeat is turned off: idle seconds, probe interval, probes
+BARCO_KEEPALIVE_IDLE = 10
+BARCO_KEEPALIVE_INTERVAL = 5
+BARCO_KEEPALIVE_COUNT = 3
+
+# Connection retry intervals, in seconds, doubled for each failed attempt
+BARCO_RETRY_INTERVAL = 2
+BARCO_RETRY_INTERVAL_FAST = 5
+BARCO_RETRY_INTERVAL_ECO = 300
+BARCO_RETRY_INTERVAL_MAX = 600
+# A session that drops within this many seconds counts as a failed attempt
+BARCO_MIN_UPTIME = 30
+# Failed attempts after which commands fail straight away
+BARCO_BREAKER_THRESHOLD = 3
+# How long a command may wait for a connection attempt already under way
+BARCO_COMMAND_WAIT = 2
+
+# Subnet discovery: probes in flight, seconds per host, and the largest scan allowed
+BARCO_DISCOVERY_CONCURRENCY = 256
+BARCO_DISCOVERY_TIMEOUT = 1.5
+BARCO_DISCOVERY_MAX_HOSTS = 4096
+
+# Shared by all projectors
+BARCO_MAX_CONCURRENT_CONNECTS = 16
+BARCO_CONNECT_STAGGER = 0.05
+BARCO_TIMER_RESOLUTION = 1
+BARCO_WOL_ADDRESS = "255.255.255.255"
+BARCO_WOL_PORT = 9
+# Seconds between repeated wake-on-lan packets, until the projector answers
+BARCO_WOL_RETRY_SCHEDULE = (1, 2, 4, 8, 15)
+# How long after a wake-on-lan the projector is expected to come up
+BARCO_WAKE_WINDOW = 180
+# While waking, how often to try the control port and how long to wait for it
+BARCO_WAKE_PROBE_INTERVAL = 0.5
+BARCO_WAKE_CONNECT_TIMEOUT = 1
+
+# Seconds to gather property changes before notifying entities (0 = next loop iteration)
+BARCO_DISPATCH_WINDOW = 0.05
@@ -1,22 +1,35 @@
 """Coordinator."""
 
-from datetime import timedelta
 import logging
 from typing import Self
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .cache import FactCache
+from .const import DOMAIN
 from .device import BarcoDevice
+from .properties import DEVICE_FIRMWARE, DEVICE_MODEL, DEVICE_SERIAL_NUM, STATIC_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
 class BarcoCoordinator(DataUpdateCoordinator):
-    """My custom coordinator."""
+    """My custom coordinator.
+
+    The device pushes changes over its property subscription and its
+    connection supervisor takes care of reconnecting, so the coordinator
+    does not poll.  A refresh only re-reads the state while connected, so
+    the first refresh at setup returns straight away.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: ConfigEntry[Self], device: BarcoDevice
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry[Self],
+        device: BarcoDevice,
+        cache: FactCache | None = None,
     ) -> None:
         """Initialize my coordinator."""
         super().__init__(
@@ -25,12 +38,13 @@ class BarcoCoordinator(DataUpdateCoordinator):
             # Name of the data. For logging purposes.
             name="Barco Coordinator",
             config_entry=config_entry,
-            update_interval=timedelta(seconds=30),
+            update_interval=None,
             setup_method=self.async_init,
             update_method=self._async_update_data,
             always_update=False,
         )
         self._device = device
+        self._cache = cache
 
     @property
     def device(self) -> BarcoDevice:
@@ -39,25 +53,57 @@ class BarcoCoordinator(DataUpdateCoordinator):
 
     async def async_init(self):
         """Init the device."""
-        await self.device.async_init(self.update_callback)
+        await self.device.async_init(self.update_callback, self._async_auth_failed)
+
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and the device connection."""
+        await super().async_shutdown()
+        await self.device.async_shutdown()
 
     async def _async_update_data(self):
-        """Polling update."""
+        """Manual refresh."""
 
-        dev_is_online = self.device.online
-        try:
-            await self.device.update_data()
-        except Exception as err:
-            if dev_is_online:
+        if self.device.online:
+            try:
+                await self.device.update_data()
+            except Exception as err:
                 _LOGGER.error("Data update failed: %s", err)
                 raise UpdateFailed(err) from err
-            else:
-                _LOGGER.info("Projector may be asleep.  Ignoring: %s", err)
         return self.device.data
 
     @callback
-    def update_callback(self, data):
-        """Incoming data callback."""
-        self.hass.add_job(self.async_set_updated_data, data)
+    def update_callback(self, changed: set[str]) -> None:
+        """Incoming data callback, called on the event loop with the changed keys.
+
+        Entities are woken through the device's key index, so only the
+        coordinator's own view of the data is refreshed here.  The data is
+        an immutable snapshot, so unchanged data compares equal and a
+        refresh that changed nothing does not wake any entity.
+        """
+        self.data = self.device.data
+        if self._cache is not None and not changed.isdisjoint(STATIC_KEYS):
+            self._async_facts_changed()
+
+    @callback
+    def _async_auth_failed(self) -> None:
+        """Ask the user for the new PIN code."""
+        self.config_entry.async_start_reauth(self.hass)
+
+    @callback
+    def _async_facts_changed(self) -> None:
+        """Cache facts the device read, and show them on the device page."""
+        facts = self.device.facts
+        if not self._cache.async_update(facts):
+            return
+        _LOGGER.debug("Device facts changed: %s", facts)
+        registry = dr.async_get(self.hass)
+        entry = registry.async_get_device(identifiers={(DOMAIN, self.device.device_id)})
+        if entry is not None:
+            registry.async_update_device(
+                entry.id,
+                model=facts.get(DEVICE_MODEL),
+                serial_number=facts.get(DEVICE_SERIAL_NUM),
+                sw_version=facts.get(DEVICE_FIRMWARE),
+            )
 
 type BarcoConfigEntry = ConfigEntry[Self]
@@ -1,66 +1,176 @@
 """Stewart Barco Device."""
 
 import asyncio
-import json
+from collections import Counter
+from collections.abc import Callable, Iterable
+from enum import StrEnum
+from functools import partial
 import logging
-from wakeonlan import send_magic_packet
+import random
+import socket
+import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     MANUFACTURER,
+    BARCO_BREAKER_THRESHOLD,
+    BARCO_COMMAND_WAIT,
     BARCO_CONNECT_TIMEOUT,
+    BARCO_DISPATCH_WINDOW,
+    BARCO_KEEPALIVE_COUNT,
+    BARCO_KEEPALIVE_IDLE,
+    BARCO_KEEPALIVE_INTERVAL,
     BARCO_LOGIN_TIMEOUT,
+    BARCO_MACRO_TIMEOUT,
+    BARCO_MAX_PENDING_REQUESTS,
+    BARCO_MIN_COMMAND_INTERVAL,
+    BARCO_MIN_UPTIME,
+    BARCO_OPTIMISTIC_TIMEOUT,
     BARCO_PORT,
+    BARCO_READ_SIZE,
+    BARCO_REQUEST_TIMEOUT,
+    BARCO_RETRY_INTERVAL,
+    BARCO_RETRY_INTERVAL_ECO,
+    BARCO_RETRY_INTERVAL_FAST,
+    BARCO_RETRY_INTERVAL_MAX,
+    BARCO_WAKE_CONNECT_TIMEOUT,
+    BARCO_WAKE_PROBE_INTERVAL,
+    BARCO_WAKE_WINDOW,
+    BARCO_WOL_RETRY_SCHEDULE,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_MISSES,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_HYSTERESIS,
+    DEFAULT_TEMP_MIN_INTERVAL,
+)
+from .filters import FilterResult, NumericFilter
+from .hub import BarcoHub
+from .macro import MacroResult, MacroStep
+from .properties import (
+    COALESCED_PROPERTIES,
+    DEVICE_AVAILABLE,
+    DEVICE_FIRMWARE,
+    DEVICE_INPUT_SOURCE,
+    DEVICE_INPUT_SOURCE_LIST,
+    DEVICE_MODEL,
+    DEVICE_ONLINE,
+    DEVICE_PENDING,
+    DEVICE_SERIAL_NUM,
+    DEVICE_SYSTEM_STATE,
+    DEVICE_SYSTEM_TARGETSTATE,
+    FILTERED_KEYS,
+    PROPERTY_BY_KEY,
+    PROPERTY_INIT,
+    PROPERTY_POLL,
+    PROPERTY_REQUIRED,
+    PROPERTY_SUBS,
+    STATE_KEYS,
+    STATIC_KEYS,
+    TRANSFORMS,
+)
+from .protocol import JsonRpcFramer, RequestTemplate, encode_batch, encode_request
+from .scheduler import PRIORITY_POLL, PRIORITY_URGENT, PRIORITY_USER, CommandScheduler
+from .state import StateSnapshot, StateStore
+from .stats import (
+    PHASE_CONNECT,
+    PHASE_PROBE,
+    PHASE_SUBSCRIBE,
+    PHASE_TOTAL,
+    POWER_COMMAND,
+    POWER_LIT,
+    POWER_ONLINE,
+    POWER_REACHABLE,
+    POWER_WOL_SENT,
+    DeviceStats,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-DEVICE_SYSTEM_TARGETSTATE = "system.targetstate"
-DEVICE_SYSTEM_STATE = "system.state"
-DEVICE_INLET_T = "environment.temperature.inlet.value"
-DEVICE_OUTLET_T = "environment.temperature.outlet.value"
-DEVICE_LASER_STATUS = "illumination.sources.laser.status"
-DEVICE_LASER_ON = "laser"
-DEVICE_HDMI_SIGNAL = "image.connector.hdmi.detectedsignal"
-DEVICE_OUTPUT_SIZE = "image.resolution.processing.size"
-DEVICE_INPUT_ACTIVE = "input_active"
-DEVICE_INPUT_SIGNAL = "input_signal"
-DEVICE_OUTPUT_HRES = "output_hres"
-DEVICE_OUTPUT_VRES = "output_vres"
-DEVICE_OUTPUT_RES = "output_res"
-DEVICE_MAINBOARD_T = "environment.temperature.mainboard.value"
-DEVICE_ILLUM_STATE = "illumination.state"
-DEVICE_ILLUM_ON = "illumination"
-DEVICE_MODEL = "system.modelname"
-DEVICE_SERIAL_NUM = "system.serialnumber"
-DEVICE_INPUT_SOURCE = "image.window.main.source"
-DEVICE_INPUT_SOURCE_LIST = "image.source.list"
-
-PROPERTY_SUBS = [
-    DEVICE_SYSTEM_TARGETSTATE,
-    DEVICE_SYSTEM_STATE,
-    DEVICE_INLET_T,
-    DEVICE_OUTLET_T,
-    DEVICE_MAINBOARD_T,
-    DEVICE_LASER_STATUS,
-    DEVICE_HDMI_SIGNAL,
-    DEVICE_OUTPUT_SIZE,
-    DEVICE_ILLUM_STATE,
-    DEVICE_INPUT_SOURCE,
-]
+URGENT_METHODS = ("system.poweron", "system.poweroff", "system.gotoready", "system.gotoeco")
+URGENT_PROPERTIES = (DEVICE_INPUT_SOURCE,)
+
+TRANSITION_STATES = ("boot", "conditioning", "deconditioning")
+POWER_ON_STATES = ("on", "conditioning")
+SLEEP_STATES = ("eco",)
+
+# Requests that never change, encoded once
+REQUEST_PROBE = RequestTemplate(
+    "property.get", {"property": [DEVICE_MODEL, DEVICE_SERIAL_NUM, DEVICE_SYSTEM_STATE]}
+)
+REQUEST_SOURCE_LIST = RequestTemplate("image.source.list", "[]")
+REQUEST_FIRMWARE = RequestTemplate("property.get", {"property": [DEVICE_FIRMWARE]})
+REQUEST_POLL = RequestTemplate("property.get", {"property": PROPERTY_POLL})
+REQUEST_POWERON = RequestTemplate("system.poweron", "[]")
+REQUEST_HEARTBEAT = RequestTemplate("property.get", {"property": [DEVICE_SYSTEM_STATE]})
+
+
+def _discard_reply(fut: asyncio.Future) -> None:
+    """Mark the reply to a request nobody waits for as seen."""
+    if not fut.cancelled() and (exc := fut.exception()) is not None:
+        _LOGGER.debug("Request failed: %s", exc)
+
+
+class _QueuedWrite:
+    """Latest value waiting for the write in flight to finish."""
+
+    __slots__ = ("value", "future")
+
+    def __init__(self, value: Any, future: asyncio.Future) -> None:
+        self.value = value
+        self.future = future
+
+
+class ConnectionState(StrEnum):
+    """Connection supervisor states."""
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    AUTHENTICATING = "authenticating"
+    SUBSCRIBED = "subscribed"
+    SLEEPING = "sleeping"
+    BACKOFF = "backoff"
 
-PROPERTY_INIT = PROPERTY_SUBS
+
+# States a connection attempt ends in
+SETTLED_STATES = (ConnectionState.SUBSCRIBED, ConnectionState.SLEEPING, ConnectionState.BACKOFF)
+
+
+class RequestError(HomeAssistantError):
+    """Error reply from the projector."""
+
+
+class NotConnectedError(HomeAssistantError):
+    """The projector cannot be reached right now."""
+
+
+class AuthenticationFailed(HomeAssistantError):
+    """The projector rejected the PIN code."""
+
+
+class DeviceNotReady(ConnectionError):
+    """The projector answered but is not ready for use."""
 
 
 class BarcoDevice:
     """Represents a single Barco device."""
 
-    def __init__(self, hass: HomeAssistant, host: str, mac: str, pin_code: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: BarcoHub,
+        host: str,
+        mac: str,
+        pin_code: str,
+        dispatch_window: float = BARCO_DISPATCH_WINDOW,
+    ) -> None:
         """Set up class."""
 
         _LOGGER.info("Initialize Barco Pulse device (host=%s, mac=%s)", host, mac)
         self._hass = hass
+        self._hub = hub
         self._host = host
         mac = mac.lower()
         self._mac = mac
@@ -76,16 +186,67 @@ class BarcoDevice:
         self._pin_code = pin_code
         self._reader: asyncio.StreamReader
         self._writer: asyncio.StreamWriter
-        self._init_event = asyncio.Event()
-        self._online = False
+        self._state = ConnectionState.DISCONNECTED
+        self._supervisor: asyncio.Task | None = None
+        self._kick = asyncio.Event()
+        self._ready = asyncio.Event()
+        self._connected = False
+        self._failures = 0
+        self._last_error: str | None = None
+        # Whether the user was told about the failures, or the PIN being rejected
+        self._reported_failure = False
+        self._pin_rejected = False
         self._poweron_pending = False
+        self._woken_at: float | None = None
+        self._reachable_at = 0.0
+        self._wake_task: asyncio.Task | None = None
+        # Start of the turn on request being timed, and the milestones it reached
+        self._power_on_started: float | None = None
+        self._power_on_seen: set[str] = set()
+        self._last_known_state: str | None = None
         self._callback = None
+        self._auth_failed_callback: Callable[[], None] | None = None
+        self._dispatch_window = dispatch_window
+        self._dispatch_handle: asyncio.Handle | None = None
+        self._dispatched_version = 0
+        self._key_listeners: dict[str, set[Callable[[], None]]] = {}
+        # Number of listeners needing each property, and what the connection is subscribed to
+        self._wanted: Counter[str] = Counter(PROPERTY_REQUIRED)
+        self._subscribed: set[str] = set()
+        self._sync_handle: asyncio.Handle | None = None
+        self._sync_task: asyncio.Task | None = None
         self._listener = None
-        self._request_id = None
-        self._requests = {}
-        self._data = {}
+        self._framer = JsonRpcFramer()
+        self._scheduler = CommandScheduler(
+            hass.loop, self.send_batch, self._drain, BARCO_MIN_COMMAND_INTERVAL
+        )
+        self._request_id = 1
+        self._requests: dict[int, tuple[str, asyncio.Future, asyncio.TimerHandle, float]] = {}
+        self._data = StateStore(STATE_KEYS)
         self._sleeping = True
-        self._connection_tested = False
+        self._stats = DeviceStats()
+        self._filters: dict[str, NumericFilter] = {}
+        self._filter_timers: dict[str, Callable[[], None]] = {}
+        self.set_filter_options(
+            DEFAULT_TEMP_DEADBAND, DEFAULT_TEMP_HYSTERESIS, DEFAULT_TEMP_MIN_INTERVAL
+        )
+        self._heartbeat_interval = DEFAULT_HEARTBEAT_INTERVAL
+        self._heartbeat_misses = DEFAULT_HEARTBEAT_MISSES
+        self._heartbeat_cancel: Callable[[], None] | None = None
+        self._missed_beats = 0
+        self._last_rx = 0.0
+        # Keys showing an optimistic value: the last real value, what confirms
+        # the optimistic one, and the canceller of its rollback timer
+        self._optimistic: dict[str, tuple[Any, Callable[[Any], bool], Callable[[], None]]] = {}
+        # Properties with a write in flight, and the write queued behind it
+        self._writing: dict[str, _QueuedWrite | None] = {}
+        # Macro steps waiting for a property to report a value
+        self._confirmations: dict[str, list[tuple[Any, asyncio.Future]]] = {}
+        # Called with the new value when these properties change
+        self._change_hooks: dict[str, Callable[[Any], None]] = {
+            DEVICE_SYSTEM_STATE: self._system_state_changed,
+            DEVICE_SYSTEM_TARGETSTATE: self._target_state_changed,
+        }
 
     @property
     def device_id(self) -> str:
@@ -94,19 +255,83 @@ class BarcoDevice:
 
     @property
     def online(self) -> bool:
-        """Return status."""
-        return self._online
+        """Return True while the property subscription is live."""
+        return self._state is ConnectionState.SUBSCRIBED
+
+    @property
+    def available(self) -> bool:
+        """Return True while the projector answers, or is being woken.
+
+        A sleeping projector still answers and can be woken; one in backoff
+        or with the breaker open cannot be controlled.  A connection attempt
+        under way keeps the outcome of the last one.
+        """
+        return bool(self._data.get(DEVICE_AVAILABLE)) or self.waking
+
+    @property
+    def connection_state(self) -> ConnectionState:
+        """Return the connection supervisor state."""
+        return self._state
+
+    @property
+    def last_known_state(self) -> str | None:
+        """Return the most recent system state, even while disconnected."""
+        return self._last_known_state
+
+    @property
+    def waking(self) -> bool:
+        """Return True shortly after a wake-up, until the device is online."""
+        return (
+            not self.online
+            and self._woken_at is not None
+            and time.monotonic() - self._woken_at < BARCO_WAKE_WINDOW
+        )
 
     @property
-    def connection_tested(self) -> bool:
-        """Return connection success."""
-        return self._connection_tested
+    def data(self) -> StateSnapshot:
+        """Return an immutable snapshot of the data."""
+        return self._data.snapshot()
 
     @property
-    def data(self) -> dict:
-        """Return data."""
+    def state(self) -> StateStore:
+        """Return the live state store."""
         return self._data
 
+    @property
+    def queue_depth(self) -> int:
+        """Number of commands waiting to be sent."""
+        return self._scheduler.queue_depth
+
+    @property
+    def pending_requests(self) -> int:
+        """Number of requests waiting for a reply."""
+        return len(self._requests)
+
+    @property
+    def last_error(self) -> str | None:
+        """Reason the last connection attempt failed."""
+        return self._last_error
+
+    @property
+    def stats(self) -> DeviceStats:
+        """Link statistics."""
+        return self._stats
+
+    @property
+    def facts(self) -> dict[str, Any]:
+        """Return the known static facts: model, serial number, firmware and sources."""
+        return {key: self._data.get(key) for key in STATIC_KEYS if key in self._data}
+
+    @callback
+    def restore_facts(self, facts: dict[str, Any]) -> None:
+        """Seed the static facts from a cache until the device is read."""
+        if self._connected:
+            return
+        for key in STATIC_KEYS:
+            if key in facts:
+                self._set(key, facts[key])
+        self._schedule_dispatch()
+
     @property
     def sensors(self) -> list[str]:
         """Return the sensor names."""
@@ -116,115 +341,585 @@ class BarcoDevice:
         """Return the sensor."""
         return self._data.get(name)
 
-    def _wake_on_lan(self) -> None:
-        """Wake the device via wake on lan."""
-        send_magic_packet(self._mac)
-
     async def wakeup(self) -> None:
-        """Wake up the device."""
+        """Wake up the device, repeating the wake-on-lan until it answers."""
         _LOGGER.info("Attempting to wake projector at %s", self._mac)
-        await self._hass.async_add_executor_job(self._wake_on_lan)
+        self._woken_at = time.monotonic()
+        self._set(DEVICE_AVAILABLE, True)
+        self._schedule_dispatch()
+        await self._hub.async_wake(self._mac)
+        self._power_on_milestone(POWER_WOL_SENT)
+        self._kick.set()
+        if self._wake_task is None or self._wake_task.done():
+            self._wake_task = self._hass.async_create_background_task(
+                self._async_repeat_wake(), f"Barco Pulse wake {self._host}"
+            )
 
-    async def check_connection(self, test: bool = False) -> None:
-        """Establish a connection."""
-        if self._online:
-            if not self._writer.is_closing():
+    async def _async_repeat_wake(self) -> None:
+        """Send the wake-on-lan again in case it was lost, until the control port opens."""
+        for delay in BARCO_WOL_RETRY_SCHEDULE:
+            await asyncio.sleep(delay)
+            if not self.waking or self._reachable_at >= self._woken_at:
                 return
+            try:
+                await self._hub.async_wake(self._mac)
+            except OSError as err:
+                _LOGGER.debug("Wake-on-lan failed: %s", err)
 
-            _LOGGER.debug("Closing connection in check_connection")
-            self._connection_closed()
-            if self._listener is not None:
-                self._listener.cancel()
-                self._listener = None
+    def _begin_power_on(self) -> None:
+        """Start timing a turn on request, unless one is already under way."""
+        now = time.monotonic()
+        started = self._power_on_started
+        if started is not None and now - started < BARCO_WAKE_WINDOW:
+            return
+        if self._data.get(DEVICE_SYSTEM_STATE) == "on":
+            self._power_on_started = None
+            return
+        self._power_on_started = now
+        self._power_on_seen = set()
 
-        try:
-            _LOGGER.debug("Attempting to establish new connection")
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, BARCO_PORT),
-                timeout=BARCO_CONNECT_TIMEOUT,
-            )
-            self._request_id = 1
-            self.send_request(
-                "property.get", {"property": [DEVICE_MODEL, DEVICE_SERIAL_NUM, DEVICE_SYSTEM_STATE]}
+    def _power_on_milestone(self, milestone: str) -> None:
+        """Record the first time the turn on request being timed reaches a milestone."""
+        if self._power_on_started is None or milestone in self._power_on_seen:
+            return
+        self._power_on_seen.add(milestone)
+        elapsed = time.monotonic() - self._power_on_started
+        self._stats.record_power_on(milestone, elapsed)
+        _LOGGER.debug("Power on: %s after %.2f s", milestone, elapsed)
+        if milestone == POWER_LIT:
+            self._power_on_started = None
+
+    @property
+    def _breaker_open(self) -> bool:
+        """Return True while commands should fail without waiting."""
+        return (
+            self._state is ConnectionState.SLEEPING
+            or self._failures >= BARCO_BREAKER_THRESHOLD
+        ) and not self.waking
+
+    def _set_state(self, state: ConnectionState) -> None:
+        """Move the connection state machine along."""
+        if state is self._state:
+            return
+        _LOGGER.debug("Connection state %s -> %s", self._state, state)
+        was_online = self._state is ConnectionState.SUBSCRIBED
+        self._state = state
+        if state is ConnectionState.SUBSCRIBED:
+            self._ready.set()
+        else:
+            self._ready.clear()
+        if was_online != (state is ConnectionState.SUBSCRIBED):
+            self._set(DEVICE_ONLINE, not was_online)
+        if state in SETTLED_STATES:
+            self._set(
+                DEVICE_AVAILABLE,
+                state is not ConnectionState.BACKOFF or self.waking,
             )
-            resp = await asyncio.wait_for(
-                self._reader.read(1000), timeout=BARCO_LOGIN_TIMEOUT
+        self._schedule_dispatch()
+
+    def _connection_failed(self, pin_rejected: bool = False) -> None:
+        """Tell the user about a failed attempt, without repeating it every retry."""
+        if pin_rejected and not self._pin_rejected:
+            self._pin_rejected = True
+            level = logging.ERROR
+            if self._auth_failed_callback is not None:
+                self._auth_failed_callback()
+        elif (
+            not pin_rejected
+            and not self.waking
+            and self._failures in (1, BARCO_BREAKER_THRESHOLD)
+        ):
+            # While waking the control port is expected to refuse for a while
+            level = logging.WARNING
+        else:
+            level = logging.DEBUG
+        if level > logging.DEBUG:
+            self._reported_failure = True
+        _LOGGER.log(
+            level,
+            "Cannot connect to %s (attempt %d%s): %s",
+            self._host,
+            self._failures,
+            ", failing commands until it answers" if self._breaker_open else "",
+            self._last_error,
+        )
+
+    def _retry_delay(self) -> float:
+        """Work out how long to wait before the next connection attempt."""
+        state = self._last_known_state
+        if self.waking:
+            # Keep trying the control port, so the handshake starts as soon as it opens
+            return BARCO_WAKE_PROBE_INTERVAL
+        if state in TRANSITION_STATES:
+            base = BARCO_RETRY_INTERVAL_FAST
+        elif state in SLEEP_STATES:
+            base = BARCO_RETRY_INTERVAL_ECO
+        else:
+            base = BARCO_RETRY_INTERVAL
+        delay = min(base * 2 ** min(self._failures, 10), BARCO_RETRY_INTERVAL_MAX)
+        # Jitter keeps projectors that dropped off together from retrying together
+        return random.uniform(delay / 2, delay)
+
+    async def _supervise(self) -> None:
+        """Keep a subscribed connection to the device."""
+        while True:
+            self._set_state(ConnectionState.CONNECTING)
+            try:
+                async with self._hub.async_connect_slot():
+                    # Timed from holding a slot, so queueing behind other
+                    # projectors does not count
+                    start = time.monotonic()
+                    await self._connect()
+            except DeviceNotReady as err:
+                _LOGGER.debug("Projector not ready: %s", err)
+                self._disconnect()
+                self._set_state(ConnectionState.SLEEPING)
+            except Exception as err:
+                self._disconnect()
+                self._failures += 1
+                self._last_error = str(err) or type(err).__name__
+                self._stats.connect_failures[type(err).__name__] += 1
+                self._connection_failed(isinstance(err, AuthenticationFailed))
+                self._set_state(ConnectionState.BACKOFF)
+            else:
+                if self._reported_failure:
+                    _LOGGER.info("Reconnected to %s", self._host)
+                self._reported_failure = self._pin_rejected = False
+                # Closed while connected, but kept in case the link does not last
+                failures, self._failures = self._failures, 0
+                self._stats.connects += 1
+                connected = time.monotonic()
+                self._stats.record_phase(PHASE_TOTAL, connected - start)
+                await asyncio.wait({self._listener})
+                uptime = time.monotonic() - connected
+                if self._sleeping:
+                    self._set_state(ConnectionState.SLEEPING)
+                elif uptime < BARCO_MIN_UPTIME:
+                    # A projector dropping every session must not be reconnected in a loop
+                    self._failures = failures + 1
+                    self._last_error = f"Connection dropped after {uptime:.1f} s"
+                    self._connection_failed()
+                    self._set_state(ConnectionState.BACKOFF)
+                else:
+                    self._set_state(ConnectionState.DISCONNECTED)
+                    continue
+
+            delay = self._retry_delay()
+            _LOGGER.debug("Next connection attempt in %.1f s", delay)
+            self._kick.clear()
+            cancel_timer = self._hub.wheel.call_later(delay, self._kick.set)
+            try:
+                await self._kick.wait()
+            finally:
+                cancel_timer()
+
+    async def _open_connection(self) -> dict:
+        """Connect and read the basic device facts."""
+        _LOGGER.debug("Attempting to establish new connection")
+        start = time.monotonic()
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, BARCO_PORT),
+            timeout=BARCO_WAKE_CONNECT_TIMEOUT if self.waking else BARCO_CONNECT_TIMEOUT,
+        )
+        self._connected = True
+        self._set_keepalive()
+        self._framer.reset()
+        self._listener = asyncio.create_task(self.listener())
+        probe_start = time.monotonic()
+        self._stats.record_phase(PHASE_CONNECT, probe_start - start)
+        result = await self.send_batch([REQUEST_PROBE], timeout=BARCO_LOGIN_TIMEOUT)[0]
+        self._stats.record_phase(PHASE_PROBE, time.monotonic() - probe_start)
+        ready_states = ["ready", "on", "conditioning"]
+        if isinstance(result, dict) and DEVICE_SYSTEM_STATE in result:
+            self._last_known_state = result[DEVICE_SYSTEM_STATE]
+        if not isinstance(result, dict) or result.get(DEVICE_SYSTEM_STATE) not in ready_states:
+            raise DeviceNotReady(f"Device not initialized ({self._last_known_state})")
+        # The control port also answers in eco, so a wake only took once the state moved on
+        self._reachable_at = time.monotonic()
+        self._power_on_milestone(POWER_REACHABLE)
+        return result
+
+    async def _connect(self) -> None:
+        """Connect, authenticate and subscribe."""
+        await self._open_connection()
+        # Before the handshake replies, whose values may put it back to sleep
+        self._sleeping = False
+
+        self._set_state(ConnectionState.AUTHENTICATING)
+        # Only subscribe to what entities currently need; anything added
+        # while the handshake is under way is picked up by the sync below.
+        wanted = set(self._wanted_properties())
+        subscribe = [name for name in PROPERTY_SUBS if name in wanted]
+        init = [name for name in PROPERTY_INIT if name in wanted]
+        start = time.monotonic()
+        # The projector works through a batch in order, so the
+        # whole handshake costs a single round trip.
+        requests = [("authenticate", {"code": int(self._pin_code)})]
+        poweron = self._poweron_pending
+        if poweron:
+            # Right after authenticating, so the lamp does not wait on the rest
+            requests.append(REQUEST_POWERON)
+        requests += [
+            ("property.subscribe", {"property": subscribe}),
+            ("property.get", {"property": init}),
+            REQUEST_SOURCE_LIST,
+            REQUEST_FIRMWARE,
+        ]
+        futs = self.send_batch(requests, timeout=BARCO_LOGIN_TIMEOUT)
+        poweron_fut = futs.pop(1) if poweron else None
+        try:
+            await futs[0]
+        except RequestError as err:
+            raise AuthenticationFailed(f"PIN code rejected: {err}") from err
+        *futs, firmware = futs
+        *_, sources = await asyncio.gather(*futs)
+        self._stats.record_phase(PHASE_SUBSCRIBE, time.monotonic() - start)
+        self._subscribed = set(subscribe)
+        self._set(DEVICE_INPUT_SOURCE_LIST, sources)
+        # Not every firmware has the property, so its reply is checked on its own
+        try:
+            await firmware
+        except RequestError as err:
+            _LOGGER.debug("Firmware version not available: %s", err)
+        self._set_state(ConnectionState.SUBSCRIBED)
+        self._power_on_milestone(POWER_ONLINE)
+        self._missed_beats = 0
+        self._schedule_heartbeat()
+        self._schedule_subscription_sync()
+        if poweron_fut is not None:
+            self._poweron_pending = False
+            try:
+                await poweron_fut
+            except RequestError as err:
+                _LOGGER.warning("Projector refused to power on: %s", err)
+            else:
+                self._power_on_milestone(POWER_COMMAND)
+
+    def _set_keepalive(self) -> None:
+        """Have the kernel probe an idle connection too."""
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, BARCO_KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, BARCO_KEEPALIVE_INTERVAL
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, BARCO_KEEPALIVE_COUNT)
+            if hasattr(socket, "TCP_USER_TIMEOUT"):
+                # Also give up on unacknowledged writes after the same time, in milliseconds
+                timeout = BARCO_KEEPALIVE_IDLE + BARCO_KEEPALIVE_INTERVAL * BARCO_KEEPALIVE_COUNT
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, timeout * 1000)
+        except OSError as err:
+            _LOGGER.debug("Could not set TCP keepalive: %s", err)
+
+    def set_heartbeat_options(self, interval: float, misses: int) -> None:
+        """Set up the link check: seconds of silence before a check, and missed replies allowed."""
+        self._heartbeat_interval = interval
+        self._heartbeat_misses = max(misses, 1)
+
+    def _schedule_heartbeat(self) -> None:
+        """Check the link again after the heartbeat interval."""
+        if self._heartbeat_interval > 0:
+            self._heartbeat_cancel = self._hub.wheel.call_later(
+                self._heartbeat_interval, self._heartbeat
             )
-            result = self.decode_response(resp)
-            ready_states = ["ready", "on", "conditioning"]
-            if result is None or result["result"].get(DEVICE_SYSTEM_STATE) not in ready_states:
-                self._connection_closed()
-                raise ConnectionError("Device not initialized")
-            for prop, val in result["result"].items():
-                self._data[prop] = val
-            if test:
-                self._connection_closed()
-                self._connection_tested = True
+
+    def _cancel_heartbeat(self) -> None:
+        if self._heartbeat_cancel is not None:
+            self._heartbeat_cancel()
+            self._heartbeat_cancel = None
+
+    def _heartbeat(self) -> None:
+        """Check the link, unless the projector spoke recently."""
+        self._heartbeat_cancel = None
+        if not self.online:
+            return
+        now = time.monotonic()
+        if not self._missed_beats and now - self._last_rx < self._heartbeat_interval:
+            self._schedule_heartbeat()
+            return
+        fut = self.send_batch([REQUEST_HEARTBEAT], timeout=self._heartbeat_interval)[0]
+        fut.add_done_callback(partial(self._heartbeat_done, now))
+        self._schedule_heartbeat()
+
+    def _heartbeat_done(self, sent: float, fut: asyncio.Future) -> None:
+        """Count a missed heartbeat, and drop the connection after too many."""
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if isinstance(exc, TimeoutError):
+            self._missed_beats += 1
+            self._stats.missed_heartbeats += 1
+            _LOGGER.debug("Missed heartbeat %d", self._missed_beats)
+            if self._missed_beats >= self._heartbeat_misses and self.online:
+                _LOGGER.warning(
+                    "No reply to %d heartbeats, dropping connection", self._missed_beats
+                )
+                self._stats.record_disconnect("heartbeat")
+                # Abort rather than close, nothing is coming back to flush to
+                self._writer.transport.abort()
+                self._disconnect()
+        elif exc is None or isinstance(exc, RequestError):
+            # Any reply, even an error, shows the link is alive
+            self._missed_beats = 0
+            self._stats.heartbeat_rtt.add((time.monotonic() - sent) * 1000)
+
+    def _disconnect(self) -> None:
+        """Tear down the connection, if any."""
+        if self._listener is not None and self._listener is not asyncio.current_task():
+            self._listener.cancel()
+        self._listener = None
+        self._connection_closed()
+
+    async def _async_wait_online(self) -> None:
+        """Make sure commands can be sent, without ever waiting on a full connect."""
+        if self._state is ConnectionState.SUBSCRIBED:
+            return
+        if self._supervisor is None:
+            raise NotConnectedError("Projector connection is not started")
+        if self._breaker_open:
+            raise NotConnectedError(f"Projector is not reachable ({self._state})")
+        # Give an attempt that is under way, or a retry of a recent
+        # failure, a short moment to complete.
+        self._kick.set()
+        try:
+            await asyncio.wait_for(self._ready.wait(), BARCO_COMMAND_WAIT)
+        except TimeoutError as err:
+            raise NotConnectedError(f"Projector is not connected ({self._state})") from err
+
+    def send_request(
+        self, method: str, params: dict, timeout: float = BARCO_REQUEST_TIMEOUT
+    ) -> asyncio.Future:
+        """Format and send command, returning a future for the reply."""
+        return self.send_batch([(method, params)], timeout)[0]
+
+    def send_batch(
+        self, requests: list[tuple[str, Any]], timeout: float = BARCO_REQUEST_TIMEOUT
+    ) -> list[asyncio.Future]:
+        """Send several requests in one write, returning a future for each reply.
+
+        Requests given as a RequestTemplate only have their id filled in.
+        """
+        parts = []
+        futs = []
+        for request in requests:
+            req_id = self._request_id
+            self._request_id += 1
+            if isinstance(request, RequestTemplate):
+                parts.append(request.encode(req_id))
             else:
-                self._online = True
-                self._sleeping = False
-                self._listener = asyncio.create_task(self.listener())
-                self.send_request("authenticate", {"code": int(self._pin_code)})
-                self.send_request("property.subscribe", {"property": PROPERTY_SUBS})
-                await asyncio.wait_for(self._init_event.wait(), timeout=BARCO_LOGIN_TIMEOUT)
-                self.send_request("property.get", {"property": PROPERTY_INIT})
-                self.send_request("image.source.list", "[]")
-                if self._poweron_pending:
-                    self.send_request("system.poweron", "[]")
-                    self._poweron_pending = False
+                parts.append(encode_request(request[0], request[1], req_id))
+            futs.append(self._add_request(req_id, request[0], timeout))
 
-        except Exception as err:
-            _LOGGER.debug("Connection failed: %s", err)
-            raise err
-
-    def send_request(self, method: str, params: dict) -> None:
-        """Format and send command."""
-        req_id = self._request_id
-        self._request_id += 1
-        req = {"jsonrpc": "2.0", "method": method, "params": params, "id": req_id}
-        reqstr = json.dumps(req)
-        _LOGGER.debug("-> %s", reqstr)
-        self._requests[req_id] = req
-        self._writer.write(reqstr.encode("ascii"))
-        return req_id
-
-    def decode_response(self, resp: str) -> dict | None:
-        """Decode the json response."""
+        data = encode_batch(parts)
+        _LOGGER.debug("-> %s", data)
+        self._writer.write(data)
+        self._stats.bytes_out += len(data)
+        return futs
+
+    def _add_request(self, req_id: int, method: str, timeout: float) -> asyncio.Future:
+        """Create the pending table entry for a request."""
+        if len(self._requests) >= BARCO_MAX_PENDING_REQUESTS:
+            oldest = next(iter(self._requests))
+            _LOGGER.warning("Too many pending requests, dropping request %d", oldest)
+            self._fail_request(oldest, RequestError("Too many pending requests"))
+
+        loop = self._hass.loop
+        fut = loop.create_future()
+        timer = loop.call_later(timeout, self._fail_request, req_id, None)
+        self._requests[req_id] = (method, fut, timer, time.monotonic())
+        self._stats.record_pending(len(self._requests))
+        fut.add_done_callback(partial(self._request_done, req_id))
+        return fut
+
+    def _pop_request(self, req_id: int) -> tuple | None:
+        """Remove a request from the pending table."""
+        entry = self._requests.pop(req_id, None)
+        if entry is not None:
+            entry[2].cancel()
+        return entry
+
+    def _request_done(self, req_id: int, fut: asyncio.Future) -> None:
+        """Clean up after a request, in particular a cancelled one."""
+        entry = self._requests.get(req_id)
+        if entry is not None and entry[1] is fut:
+            self._pop_request(req_id)
+        if not fut.cancelled() and (exc := fut.exception()) is not None:
+            # Fire-and-forget callers never look at the result
+            _LOGGER.debug("Request %d failed: %s", req_id, exc)
+
+    def _fail_request(self, req_id: int, exc: Exception | None) -> None:
+        """Fail a pending request, with a timeout if no error is given."""
+        entry = self._pop_request(req_id)
+        if entry is None or entry[1].done():
+            return
+        if exc is None:
+            exc = TimeoutError(f"No reply to {entry[0]}")
+            self._stats.timeouts[entry[0]] += 1
+        entry[1].set_exception(exc)
+
+    def _resolve_request(self, resp: dict) -> None:
+        """Complete the future waiting for a reply."""
+        req_id = resp.get("id")
+        entry = self._pop_request(req_id)
+        if entry is None:
+            _LOGGER.debug("Reply to unknown request %s", req_id)
+            return
+        method, fut, _, sent = entry
+        rtt = time.monotonic() - sent
+        self._stats.record_rtt(method, rtt)
+        _LOGGER.debug("req_id=%d method=%s took %.1f ms", req_id, method, rtt * 1000)
+        if "error" in resp:
+            if not fut.done():
+                fut.set_exception(RequestError(f"{method}: {resp['error']}"))
+            return
+        result = resp.get("result")
+        if method == "property.get" and isinstance(result, dict):
+            # Applied here, in the order replies and notifications arrive, so
+            # an older reply cannot overwrite a change read alongside it
+            self.property_update(result)
+        if not fut.done():
+            fut.set_result(result)
+
+    def validate_response(self, jresp: Any) -> list[dict] | None:
+        """Pick the valid messages out of a decoded response, which may be a batch."""
+        _LOGGER.debug("<- %s", jresp)
+        jresps = jresp if isinstance(jresp, list) else [jresp]
+        valid = []
+        for r in jresps:
+            if isinstance(r, dict) and r.get("jsonrpc") == "2.0":
+                if "error" in r:
+                    # Requests fail with RequestError, reported by whoever sent them
+                    _LOGGER.debug("Error response: %s", r["error"])
+                valid.append(r)
+        return valid or None
+
+    async def _drain(self) -> None:
+        """Wait for the socket's write buffer to empty."""
+        await self._writer.drain()
+
+    @staticmethod
+    def _command_priority(method: str, params: Any) -> int:
+        """Pick the scheduling class of a command."""
+        if method in URGENT_METHODS:
+            return PRIORITY_URGENT
+        if (
+            method == "property.set"
+            and isinstance(params, dict)
+            and params.get("property") in URGENT_PROPERTIES
+        ):
+            return PRIORITY_URGENT
+        return PRIORITY_USER
+
+    async def send_command(self, method: str, params: str, priority: int | None = None) -> Any:
+        """Make an API call and return the result."""
+        if (
+            method == "property.set"
+            and isinstance(params, dict)
+            and (name := params.get("property")) in COALESCED_PROPERTIES
+        ):
+            step = await self._coalesce_write(name, params.get("value"))
+            if step.error is not None:
+                raise RequestError(step.error)
+            return True
+        return (await self.send_commands([(method, params)], priority))[0]
+
+    async def _coalesce_write(self, name: str, value: Any) -> MacroStep:
+        """Set a property, collapsing writes made while one is in flight.
+
+        Each write is a one-step macro, so it stays in flight until the
+        projector confirms the change.  Values arriving meanwhile replace
+        each other, and only the last one is written once it is done;
+        every caller it replaced gets its outcome.
+        """
+        if name in self._writing:
+            queued = self._writing[name]
+            if queued is None:
+                future = self._hass.loop.create_future()
+                # Nobody may be left waiting for the outcome
+                future.add_done_callback(_discard_reply)
+                queued = self._writing[name] = _QueuedWrite(value, future)
+            else:
+                queued.value = value
+                self._stats.coalesced_writes += 1
+            return await asyncio.shield(queued.future)
+
+        self._writing[name] = None
         try:
-            _LOGGER.debug("<- %s", resp)
-            jresp = json.loads(resp)
-            if jresp.get("jsonrpc") == "2.0" and "error" not in jresp:
-                return jresp
+            return await self._write_property(name, value)
+        finally:
+            self._write_next(name)
 
-        except json.JSONDecodeError as exc:
-            _LOGGER.error("Decode error: %s", exc)
+    async def _write_property(self, name: str, value: Any) -> MacroStep:
+        """Set a property and wait for the projector to report it."""
+        result = await self.run_macro([MacroStep.set_property(name, value)])
+        return result.steps[0]
 
-        return None
+    def _write_next(self, name: str) -> None:
+        """Start the write queued behind the one that just finished, if any."""
+        queued = self._writing.pop(name, None)
+        if queued is not None:
+            self._writing[name] = None
+            self._hass.async_create_background_task(
+                self._write_queued(name, queued), f"Barco Pulse write {name}"
+            )
 
-    async def test_connection(self) -> None:
-        """Test a connect."""
-        await self.check_connection(test=True)
+    async def _write_queued(self, name: str, queued: _QueuedWrite) -> None:
+        """Write the last queued value, and hand the outcome to everyone waiting."""
+        try:
+            result = await self._write_property(name, queued.value)
+        except asyncio.CancelledError:
+            queued.future.cancel()
+            raise
+        except Exception as err:
+            queued.future.set_exception(err)
+        else:
+            queued.future.set_result(result)
+        finally:
+            self._write_next(name)
 
-    async def send_command(self, method: str, params: str) -> None:
-        """Make an API call."""
-        if not self._online and method in ("system.gotoready", "system.poweron"):
+    async def send_commands(
+        self, commands: list[tuple[str, Any]], priority: int | None = None
+    ) -> list[Any]:
+        """Make several API calls in a single batch and return their results."""
+        methods = [method for method, _ in commands]
+        if "system.poweron" in methods:
+            self._begin_power_on()
+        if not self.online and any(m in ("system.gotoready", "system.poweron") for m in methods):
             _LOGGER.warning("Projector is not online, waking up")
             await self.wakeup()
-            if method == "system.poweron":
+            if "system.poweron" in methods:
                 self._poweron_pending = True
-        else:
-            await self.check_connection()
-            self.send_request(method, params)
+            return [None] * len(commands)
+
+        await self._async_wait_online()
+        if priority is None:
+            priority = min(self._command_priority(method, params) for method, params in commands)
+        results = await asyncio.gather(
+            *self._scheduler.submit(commands, priority), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if "system.poweron" in methods:
+            self._power_on_milestone(POWER_COMMAND)
+        return results
 
     async def update_data(self) -> None:
         """Stuff that has to be polled."""
         _LOGGER.debug("Updating data")
-        await self.send_command("property.get", {"property": [DEVICE_SYSTEM_TARGETSTATE, DEVICE_SYSTEM_STATE]})
+        # The values are applied as the reply arrives
+        await self.send_commands([REQUEST_POLL], PRIORITY_POLL)
 
     @property
     def is_on(self) -> bool:
         """Is Projector on."""
-        return self._data.get(DEVICE_SYSTEM_TARGETSTATE) in ["on", "conditioning"]
+        return self._data.get(DEVICE_SYSTEM_TARGETSTATE) in POWER_ON_STATES
 
     @property
     def source_list(self) -> list[str]:
@@ -238,103 +933,488 @@ class BarcoDevice:
 
     async def turn_on(self) -> None:
         """Turn on the power."""
-        await self.send_command("system.poweron", "[]")
+        # Waking from eco takes a while before anything can confirm
+        timeout = BARCO_OPTIMISTIC_TIMEOUT if self.online else BARCO_WAKE_WINDOW
+        self._apply_optimistic(
+            DEVICE_SYSTEM_TARGETSTATE, "on", lambda v: v in POWER_ON_STATES, timeout
+        )
+        try:
+            await self.send_command("system.poweron", "[]")
+        except Exception:
+            self._rollback(DEVICE_SYSTEM_TARGETSTATE)
+            raise
 
     async def turn_off(self) -> None:
         """Turn on the power."""
-        await self.send_command("system.poweroff", "[]")
+        self._apply_optimistic(
+            DEVICE_SYSTEM_TARGETSTATE, "ready", lambda v: v not in POWER_ON_STATES
+        )
+        try:
+            await self.send_command("system.poweroff", "[]")
+        except Exception:
+            self._rollback(DEVICE_SYSTEM_TARGETSTATE)
+            raise
 
     async def select_source(self, source: str) -> None:
-        """Set the input."""
-        await self.send_command("property.set", {"property": DEVICE_INPUT_SOURCE, "value": source})
+        """Set the input, and wait for the projector to switch.
+
+        Sources picked while a switch is under way collapse to the last one.
+        """
+        self._apply_optimistic(DEVICE_INPUT_SOURCE, source, lambda v: v == source)
+        try:
+            step = await self._coalesce_write(DEVICE_INPUT_SOURCE, source)
+        except Exception:
+            self._rollback(DEVICE_INPUT_SOURCE, source)
+            raise
+        if step.error is not None:
+            self._rollback(DEVICE_INPUT_SOURCE, source)
+            raise RequestError(step.error)
+        if step.confirmed is None or step.value != source:
+            # Unconfirmed, or replaced by a write that did not show this source
+            _LOGGER.debug("Source change to %s not confirmed", step.value)
+            self._rollback(DEVICE_INPUT_SOURCE, source)
+
+    def is_pending(self, key: str) -> bool:
+        """Return True while key shows an optimistic value."""
+        return key in self._optimistic
+
+    def _apply_optimistic(
+        self,
+        key: str,
+        value: Any,
+        confirms: Callable[[Any], bool],
+        timeout: float = BARCO_OPTIMISTIC_TIMEOUT,
+    ) -> None:
+        """Show value for key straight away, until the projector confirms or it times out.
+
+        confirms tells whether a value reported for key bears the
+        optimistic one out.  Other reported values are kept back and
+        shown if the optimistic value is rolled back.
+        """
+        pending = self._optimistic.pop(key, None)
+        if pending is not None:
+            real = pending[0]
+            pending[2]()
+        else:
+            real = self._data.get(key)
+        cancel = self._hub.wheel.call_later(timeout, partial(self._rollback, key))
+        self._optimistic[key] = (real, confirms, cancel)
+        self._data.set(key, value)
+        self._data.set(DEVICE_PENDING, tuple(sorted(self._optimistic)))
+        self._schedule_dispatch()
+
+    def _reconcile(self, key: str, value: Any) -> bool:
+        """Take a reported value for an optimistic key, returning True if it confirms it."""
+        real, confirms, cancel = self._optimistic[key]
+        if not confirms(value):
+            self._optimistic[key] = (value, confirms, cancel)
+            return False
+        cancel()
+        del self._optimistic[key]
+        self._data.set(DEVICE_PENDING, tuple(sorted(self._optimistic)))
+        return True
 
-    async def async_init(self, data_callback: callback) -> None:
-        """Initialize the device."""
+    def _rollback(self, key: str, shown: Any = None) -> None:
+        """Go back to the last reported value of an unconfirmed key.
+
+        If shown is given, only while key still shows that value, so a
+        later optimistic value is left alone.
+        """
+        if shown is not None and self._data.get(key) != shown:
+            return
+        pending = self._optimistic.pop(key, None)
+        if pending is None:
+            return
+        real, _, cancel = pending
+        cancel()
+        _LOGGER.info("%s not confirmed, back to %s", key, real)
+        self._data.set(key, real)
+        self._data.set(DEVICE_PENDING, tuple(sorted(self._optimistic)))
+        self._schedule_dispatch()
+
+    async def run_macro(
+        self, steps: list[MacroStep], timeout: float = BARCO_MACRO_TIMEOUT
+    ) -> MacroResult:
+        """Send all steps in one batch and wait until their changes are confirmed.
+
+        The batch subscribes to any property the steps set that is not
+        subscribed yet, and ends with a read of those properties, so values
+        that are already in place confirm straight away and the rest
+        confirm from their change notifications.
+        """
+        if not steps:
+            raise ValueError("A macro needs at least one step")
+        await self._async_wait_online()
+        props = list(dict.fromkeys(step.prop for step in steps if step.prop is not None))
+        subscribe = [name for name in props if name not in self._subscribed]
+        requests: list[tuple[str, Any]] = []
+        if subscribe:
+            requests.append(("property.subscribe", {"property": subscribe}))
+            self._subscribed.update(subscribe)
+        requests += [(step.method, step.params) for step in steps]
+        if props:
+            requests.append(("property.get", {"property": props}))
+        self._wanted.update(props)
+
+        result = MacroResult(steps)
+        waiting: list[asyncio.Future] = []
+        loop = self._hass.loop
+        for step in steps:
+            if step.prop is not None:
+                confirmed = loop.create_future()
+                confirmed.add_done_callback(step.confirm)
+                self._confirmations.setdefault(step.prop, []).append((step.value, confirmed))
+                waiting.append(confirmed)
+        priority = min(self._command_priority(step.method, step.params) for step in steps)
+        replies = self._scheduler.submit(requests, priority)
+        if subscribe:
+            replies[0].add_done_callback(_discard_reply)
+        if props:
+            replies[-1].add_done_callback(_discard_reply)
+        futs = replies[bool(subscribe) : len(replies) - bool(props)]
+        confirming = iter(waiting)
+        for step, fut in zip(steps, futs):
+            fut.add_done_callback(step.ack)
+            if step.prop is not None:
+                # A rejected step will never be confirmed
+                confirmed = next(confirming)
+                fut.add_done_callback(
+                    lambda f, c=confirmed: c.cancel() if f.cancelled() or f.exception() else None
+                )
+        try:
+            await asyncio.wait([*futs, *waiting], timeout=timeout)
+        finally:
+            for fut in (*futs, *waiting):
+                fut.cancel()
+            self._macro_done(props, waiting)
+        result.finished = time.monotonic()
+        _LOGGER.debug("Macro of %d steps: %s", len(steps), result.as_dict())
+        return result
+
+    def _macro_done(self, props: list[str], waiting: list[asyncio.Future]) -> None:
+        """Forget a macro's confirmations and drop subscriptions only it needed."""
+        for name in props:
+            pending = [w for w in self._confirmations.get(name, ()) if w[1] not in waiting]
+            if pending:
+                self._confirmations[name] = pending
+            else:
+                self._confirmations.pop(name, None)
+        self._wanted.subtract(props)
+        drop = []
+        for name in props:
+            if self._wanted[name] <= 0:
+                del self._wanted[name]
+                if name in self._subscribed and name not in PROPERTY_SUBS:
+                    drop.append(name)
+        if drop and self.online:
+            self._subscribed.difference_update(drop)
+            self._scheduler.submit(
+                [("property.unsubscribe", {"property": drop})], PRIORITY_POLL
+            )[0].add_done_callback(_discard_reply)
+        # Registered properties are dropped by the usual sync
+        self._schedule_subscription_sync()
+
+    def _confirm(self, updates: dict[str, Any]) -> None:
+        """Confirm macro steps waiting for these values."""
+        now = time.monotonic()
+        for name, value in updates.items():
+            for expected, fut in self._confirmations.get(name, ()):
+                if value == expected and not fut.done():
+                    fut.set_result(now)
+
+    async def async_init(
+        self, data_callback: callback, auth_failed: Callable[[], None] | None = None
+    ) -> None:
+        """Initialize the device and start the connection supervisor.
+
+        auth_failed is called when the projector starts rejecting the PIN code.
+        """
         self._callback = data_callback
+        self._auth_failed_callback = auth_failed
+        if self._supervisor is None:
+            self._supervisor = self._hass.async_create_background_task(
+                self._supervise(), f"Barco Pulse supervisor {self._host}"
+            )
+
+    async def async_shutdown(self) -> None:
+        """Stop talking to the device."""
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        if self._wake_task is not None:
+            self._wake_task.cancel()
+            self._wake_task = None
+        for _, _, cancel in self._optimistic.values():
+            cancel()
+        self._optimistic.clear()
+        await self._scheduler.stop()
+        self._disconnect()
+        self._set_state(ConnectionState.DISCONNECTED)
 
     async def listener(self) -> None:
         """Listen for status updates from device."""
 
-        while self._online and not self._sleeping:
+        stats = self._stats
+        while True:
             try:
-                buf = await self._reader.read(4096)
-                if len(buf) == 0:
-                    _LOGGER.error("Connection closed")
-                    self._online = False
-                else:
-                    jbufs = buf.split(b'{"jsonrpc')
-                    for jbuf in jbufs[1:]:
-                        resp = self.decode_response(b'{"jsonrpc' + jbuf)
-                        if resp is None:
-                            continue
-                        req_id = resp.get("id")
-                        if req_id is not None:
-                            req = self._requests[req_id]
-                            _LOGGER.debug("req_id=%d req=%s", req_id, req)
-                            if req is not None:
-                                del self._requests[req_id]
-                                if req["method"] == "property.subscribe":
-                                    _LOGGER.debug("listener initialized")
-                                    self._init_event.set()
-                                elif req["method"] == "property.get":
-                                    self.property_update(resp.get("result"))
-                                elif req["method"] == "image.source.list":
-                                    self._data[DEVICE_INPUT_SOURCE_LIST] = resp.get("result")
-                        elif resp.get("method") == "property.changed":
-                            self.property_update(resp["params"]["property"][0])
-
-            except asyncio.IncompleteReadError as err:
+                buf = await self._reader.read(BARCO_READ_SIZE)
+            except (asyncio.IncompleteReadError, OSError) as err:
                 _LOGGER.error("Connection lost: %s", err)
-                self._online = False
-                self._reader.close()
-                self._writer.close()
+                reason = type(err).__name__
+                break
+            if len(buf) == 0:
+                if not self._writer.is_closing():
+                    _LOGGER.error("Connection closed")
+                reason = "closed"
+                break
+            stats.bytes_in += len(buf)
+            self._last_rx = time.monotonic()
+            for msg in self._framer.decode(buf):
+                for resp in self.validate_response(msg) or ():
+                    if resp.get("id") is not None:
+                        self._resolve_request(resp)
+                    elif "error" in resp:
+                        # Not tied to a request, so nobody else will report it
+                        _LOGGER.warning("Error from projector: %s", resp["error"])
+                    elif resp.get("method") == "property.changed":
+                        for updates in resp["params"]["property"]:
+                            start = time.perf_counter()
+                            self.property_update(updates)
+                            stats.update_time.add((time.perf_counter() - start) * 1000)
+                            if updates:
+                                stats.notifications.update(updates.keys())
+            if self._sleeping and self.online:
+                reason = "sleep"
+                break
 
         _LOGGER.info("Closing connection in listener")
+        if self.online:
+            stats.record_disconnect(reason)
         self._connection_closed()
 
     def _connection_closed(self) -> None:
         """Connection closed."""
+        if not self._connected:
+            return
+        self._connected = False
         self._writer.close()
-        self._online = False
-        self._init_event.clear()
+        if self._state is ConnectionState.SUBSCRIBED:
+            self._set_state(ConnectionState.DISCONNECTED)
+        for _, fut, timer, _ in self._requests.values():
+            timer.cancel()
+            if not fut.done():
+                fut.set_exception(ConnectionError("Connection closed"))
         self._requests.clear()
-        self._data.clear()
+        self._scheduler.clear(ConnectionError("Connection closed"))
+        self._subscribed.clear()
+        self._cancel_heartbeat()
+        self._cancel_filter_timers()
+        for flt in self._filters.values():
+            flt.reset()
+        # Optimistic values stay until confirmed or rolled back, even across a reconnect
+        self._data.clear(
+            keep=(DEVICE_ONLINE, DEVICE_AVAILABLE, *STATIC_KEYS, DEVICE_PENDING, *self._optimistic)
+        )
+        self._schedule_dispatch()
+
+    def _set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        self._data.set(key, value)
+
+    def _schedule_dispatch(self) -> None:
+        """Deliver the changed keys once the coalescing window closes."""
+        if self._dispatch_handle is not None or self._data.version == self._dispatched_version:
+            return
+        loop = self._hass.loop
+        if self._dispatch_window > 0:
+            self._dispatch_handle = loop.call_later(self._dispatch_window, self._dispatch)
+        else:
+            self._dispatch_handle = loop.call_soon(self._dispatch)
+
+    @callback
+    def async_add_key_listener(
+        self, keys: Iterable[str], update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call update_callback whenever one of keys changes.
+
+        The properties behind keys are subscribed to for as long as the
+        listener is registered.
+        """
+        keys = tuple(keys)
+        for key in keys:
+            self._key_listeners.setdefault(key, set()).add(update_callback)
+        props = [PROPERTY_BY_KEY[key] for key in keys if key in PROPERTY_BY_KEY]
+        self._wanted.update(props)
+        self._schedule_subscription_sync()
+
+        @callback
+        def remove_listener() -> None:
+            for key in keys:
+                listeners = self._key_listeners.get(key)
+                if listeners is not None:
+                    listeners.discard(update_callback)
+                    if not listeners:
+                        del self._key_listeners[key]
+            self._wanted.subtract(props)
+            self._schedule_subscription_sync()
+
+        return remove_listener
+
+    def _wanted_properties(self) -> list[str]:
+        """Properties some listener needs, in registry order."""
+        return [name for name in PROPERTY_SUBS if self._wanted[name] > 0]
+
+    def _schedule_subscription_sync(self) -> None:
+        """Bring the subscriptions in line with the listeners soon.
+
+        Deferred to the next loop iteration so that entities added or
+        removed together cost a single batch.
+        """
+        if self._sync_handle is None:
+            self._sync_handle = self._hass.loop.call_soon(self._start_subscription_sync)
+
+    def _start_subscription_sync(self) -> None:
+        self._sync_handle = None
+        if self.online and self._sync_task is None:
+            self._sync_task = self._hass.async_create_background_task(
+                self._async_sync_subscriptions(), f"Barco Pulse subscriptions {self._host}"
+            )
+
+    async def _async_sync_subscriptions(self) -> None:
+        """Subscribe to newly wanted properties and drop unwanted ones."""
+        try:
+            while self.online:
+                wanted = set(self._wanted_properties())
+                add = [name for name in PROPERTY_SUBS if name in wanted - self._subscribed]
+                drop = [name for name in PROPERTY_SUBS if name in self._subscribed - wanted]
+                if not add and not drop:
+                    return
+                _LOGGER.debug("Subscribing to %s, unsubscribing from %s", add, drop)
+                requests = []
+                if add:
+                    requests.append(("property.subscribe", {"property": add}))
+                    requests.append(
+                        ("property.get", {"property": [n for n in PROPERTY_INIT if n in add]})
+                    )
+                if drop:
+                    requests.append(("property.unsubscribe", {"property": drop}))
+                self._subscribed.update(add)
+                self._subscribed.difference_update(drop)
+                results = await asyncio.gather(
+                    *self._scheduler.submit(requests, PRIORITY_POLL), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        _LOGGER.debug("Subscription update failed: %s", result)
+        finally:
+            self._sync_task = None
+
+    def _dispatch(self) -> None:
+        """Hand all changes since the last dispatch to the interested listeners."""
+        self._dispatch_handle = None
+        changed = set(self._data.changed_since(self._dispatched_version))
+        self._dispatched_version = self._data.version
+        if not changed:
+            return
+        woken = set()
+        for key in changed:
+            listeners = self._key_listeners.get(key)
+            if listeners:
+                woken.update(listeners)
+        for update_callback in woken:
+            update_callback()
         if self._callback is not None:
-            self._callback(self._data)
+            self._callback(changed)
+
+    def set_filter_options(
+        self,
+        deadband: float,
+        hysteresis: float,
+        min_interval: float,
+        keys: Iterable[str] = FILTERED_KEYS,
+    ) -> None:
+        """Set up filtering of the noisy numeric values, or only of the given keys."""
+        for key in keys:
+            if (cancel := self._filter_timers.pop(key, None)) is not None:
+                cancel()
+            self._filters[key] = NumericFilter(deadband, hysteresis, min_interval)
+
+    def _set_filtered(self, flt: NumericFilter, key: str, value: float) -> None:
+        """Store a numeric value if it moved far enough."""
+        now = self._hass.loop.time()
+        result = flt.check(value, now)
+        if result is FilterResult.ACCEPT:
+            self._data.set(key, value)
+        elif result is FilterResult.DEFER and key not in self._filter_timers:
+            self._filter_timers[key] = self._hub.wheel.call_later(
+                flt.delay(now), partial(self._flush_filtered, key)
+            )
+
+    def _flush_filtered(self, key: str) -> None:
+        """Publish a value held back by the minimum interval."""
+        self._filter_timers.pop(key, None)
+        flt = self._filters.get(key)
+        if flt is None or (value := flt.pending) is None:
+            return
+        flt.publish(value, self._hass.loop.time())
+        self._data.set(key, value)
+        self._schedule_dispatch()
+
+    def _cancel_filter_timers(self) -> None:
+        for cancel in self._filter_timers.values():
+            cancel()
+        self._filter_timers.clear()
+
+    def _system_state_changed(self, state: str) -> None:
+        """Track the projector state."""
+        _LOGGER.info("Projector state: %s", state)
+        self._last_known_state = state
+        if state == "on":
+            self._power_on_milestone(POWER_LIT)
+        if state in SLEEP_STATES:
+            _LOGGER.info("Projector going to sleep")
+            self._sleeping = True
+
+    def _target_state_changed(self, state: str) -> None:
+        """Track the projector target state."""
+        _LOGGER.info("Projector target state: %s", state)
+        if state in SLEEP_STATES:
+            _LOGGER.info("Projector going to sleep")
+            self._sleeping = True
 
     def property_update(self, updates) -> None:
         """Update properties."""
         try:
             if updates is None:
                 return
+            if self._confirmations:
+                self._confirm(updates)
+            store = self._data.set
+            filters = self._filters
+            optimistic = self._optimistic
             for n, v in updates.items():
                 _LOGGER.debug("Projector update: %s=%s", n, v)
-                if n == DEVICE_HDMI_SIGNAL:
-                    self._data[DEVICE_INPUT_ACTIVE] = v["active"]
-                    self._data[DEVICE_INPUT_SIGNAL] = v["name"]
-                elif n == DEVICE_OUTPUT_SIZE:
-                    pixels = self._data[DEVICE_OUTPUT_HRES] = v["pixels"]
-                    lines = self._data[DEVICE_OUTPUT_VRES] = v["lines"]
-                    self._data[DEVICE_OUTPUT_RES] = f"{pixels}x{lines}"
-                elif n in (DEVICE_INLET_T, DEVICE_OUTLET_T, DEVICE_MAINBOARD_T):
-                    self._data[n] = (v / 5 * 9) + 32
-                elif n == DEVICE_ILLUM_STATE:
-                    self._data[DEVICE_ILLUM_ON] = (v == "On")
-                elif n == DEVICE_LASER_STATUS:
-                    self._data[DEVICE_LASER_ON] = (v == "On")
-                    self._data[DEVICE_LASER_STATUS] = v
-                else:
-                    if v != self._data.get(n):
-                        if n == DEVICE_SYSTEM_STATE:
-                            _LOGGER.info("Projector state: %s", v)
-                        elif n == DEVICE_SYSTEM_TARGETSTATE:
-                            _LOGGER.info("Projector target state: %s", v)
-                        if n in (DEVICE_SYSTEM_STATE, DEVICE_SYSTEM_TARGETSTATE) and v == "eco":
-                            _LOGGER.info("Projector going to sleep")
-                            self._sleeping = True
-                        self._data[n] = v
-            if self._callback is not None:
-                self._callback(self._data)
+                transform = TRANSFORMS.get(n)
+                if transform is not None:
+                    for key, value in transform(v):
+                        if (flt := filters.get(key)) is None:
+                            store(key, value)
+                        else:
+                            self._set_filtered(flt, key, value)
+                elif n in optimistic and not self._reconcile(n, v):
+                    # Held back while the optimistic value may still be confirmed
+                    continue
+                elif store(n, v) and (hook := self._change_hooks.get(n)) is not None:
+                    hook(v)
 
         except Exception as exc:
             _LOGGER.error("Exception in property update: %s", exc)
+
+        self._schedule_dispatch()
@@ -0,0 +1,36 @@
+"""Diagnostics support for Barco Pulse."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PIN_CODE
+from .coordinator import BarcoConfigEntry
+
+TO_REDACT = {CONF_PIN_CODE, CONF_MAC}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: BarcoConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device = entry.runtime_data.device
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "device": {
+            "connection_state": device.connection_state,
+            "last_known_state": device.last_known_state,
+            "last_error": device.last_error,
+            "pending_requests": device.pending_requests,
+            "queued_commands": device.queue_depth,
+            "data": dict(device.data),
+        },
+        "stats": device.stats.as_dict(),
+    }
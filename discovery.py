@@ -0,0 +1,152 @@
+"""Find Barco Pulse projectors on the local network."""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+import ipaddress
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    BARCO_DISCOVERY_CONCURRENCY,
+    BARCO_DISCOVERY_MAX_HOSTS,
+    BARCO_DISCOVERY_TIMEOUT,
+    BARCO_PORT,
+    BARCO_READ_SIZE,
+)
+from .properties import DEVICE_MODEL, DEVICE_SERIAL_NUM
+from .protocol import JsonRpcFramer, encode_batch, encode_request
+
+_LOGGER = logging.getLogger(__name__)
+
+ARP_TABLE = "/proc/net/arp"
+# ATF_COM: the neighbour entry is complete
+ARP_FLAG_COMPLETE = 0x2
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredProjector:
+    """A projector that answered on the control port."""
+
+    host: str
+    model: str
+    serial: str
+    # None if the projector is routed rather than on a local segment
+    mac: str | None = None
+    # None if no PIN was given to check
+    authenticated: bool | None = None
+
+
+def scan_hosts(subnets: Iterable[str]) -> list[str]:
+    """List the host addresses of the given networks, in order and without duplicates.
+
+    Raises ValueError if there are more than BARCO_DISCOVERY_MAX_HOSTS in all.
+    """
+    hosts: dict[str, None] = {}
+    for subnet in subnets:
+        network = ipaddress.ip_network(subnet.strip(), strict=False)
+        # Checked before listing too, so a huge network is never listed
+        if network.num_addresses > BARCO_DISCOVERY_MAX_HOSTS:
+            raise ValueError(f"{network} is too large to scan")
+        hosts.update((str(host), None) for host in network.hosts())
+        if len(hosts) > BARCO_DISCOVERY_MAX_HOSTS:
+            raise ValueError(f"More than {BARCO_DISCOVERY_MAX_HOSTS} hosts to scan")
+    return list(hosts)
+
+
+async def async_probe(
+    host: str, pin_code: str | None = None, timeout: float = BARCO_DISCOVERY_TIMEOUT
+) -> DiscoveredProjector | None:
+    """Ask one host for its model and serial number, and optionally check the PIN."""
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, BARCO_PORT), timeout=timeout
+        )
+    except (OSError, TimeoutError):
+        return None
+    try:
+        parts = [
+            encode_request(
+                "property.get", {"property": [DEVICE_MODEL, DEVICE_SERIAL_NUM]}, 1
+            )
+        ]
+        if pin_code:
+            parts.append(encode_request("authenticate", {"code": int(pin_code)}, 2))
+        writer.write(encode_batch(parts))
+        replies = await asyncio.wait_for(_read_replies(reader, len(parts)), timeout=timeout)
+    except (OSError, TimeoutError, ValueError) as err:
+        _LOGGER.debug("%s answered on %d but not as a projector: %s", host, BARCO_PORT, err)
+        return None
+    finally:
+        writer.close()
+
+    facts = replies.get(1, {}).get("result")
+    if not isinstance(facts, dict) or not facts.get(DEVICE_MODEL):
+        return None
+    authenticated = None
+    if pin_code:
+        authenticated = "result" in replies.get(2, {})
+    return DiscoveredProjector(
+        host=host,
+        model=facts[DEVICE_MODEL],
+        serial=str(facts.get(DEVICE_SERIAL_NUM, "")),
+        authenticated=authenticated,
+    )
+
+
+async def _read_replies(reader: asyncio.StreamReader, count: int) -> dict[int, dict[str, Any]]:
+    """Read until count replies have arrived, keyed by request id."""
+    framer = JsonRpcFramer()
+    replies: dict[int, dict[str, Any]] = {}
+    while len(replies) < count:
+        data = await reader.read(BARCO_READ_SIZE)
+        if not data:
+            raise ValueError("Connection closed")
+        for msg in framer.decode(data):
+            for resp in msg if isinstance(msg, list) else (msg,):
+                if isinstance(resp, dict) and isinstance(resp.get("id"), int):
+                    replies[resp["id"]] = resp
+    return replies
+
+
+def read_neighbours(path: str = ARP_TABLE) -> dict[str, str]:
+    """Read the kernel's IPv4 neighbour table, mapping address to MAC."""
+    neighbours = {}
+    try:
+        with open(path, encoding="ascii") as table:
+            next(table, None)
+            for line in table:
+                fields = line.split()
+                if len(fields) >= 4 and int(fields[2], 16) & ARP_FLAG_COMPLETE:
+                    neighbours[fields[0]] = fields[3].lower()
+    except OSError as err:
+        _LOGGER.debug("Cannot read the neighbour table: %s", err)
+    return neighbours
+
+
+async def async_discover(
+    hass: HomeAssistant,
+    subnets: Iterable[str],
+    pin_code: str | None = None,
+    concurrency: int = BARCO_DISCOVERY_CONCURRENCY,
+) -> list[DiscoveredProjector]:
+    """Scan subnets for projectors, many hosts at a time.
+
+    Talking to a host leaves its MAC address in the neighbour table, so
+    the table is read once the scan is done.
+    """
+    hosts = scan_hosts(subnets)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> DiscoveredProjector | None:
+        async with slots:
+            return await async_probe(host, pin_code)
+
+    found = [unit for unit in await asyncio.gather(*map(probe, hosts)) if unit is not None]
+    _LOGGER.debug("Scanned %d hosts, found %d projectors", len(hosts), len(found))
+    if not found:
+        return []
+    neighbours = await hass.async_add_executor_job(read_neighbours)
+    return [replace(unit, mac=neighbours.get(unit.host)) for unit in found]
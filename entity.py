@@ -8,7 +8,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
 from .coordinator import BarcoCoordinator
-from .device import DEVICE_MODEL, BarcoDevice
+from .device import BarcoDevice
+from .properties import DEVICE_FIRMWARE, DEVICE_MODEL, DEVICE_SERIAL_NUM
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,13 +28,31 @@ class BarcoEntity(CoordinatorEntity[BarcoCoordinator]):
         self._attr_name = desc.key
         self._attr_unique_id = f"{self.coordinator.device.device_id}_{self.device_id}"
         _LOGGER.debug("%s", self.unique_id)
+        facts = coordinator.device.facts
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.device.device_id)},
             manufacturer=MANUFACTURER,
             name=coordinator.device.device_id,
+            model=facts.get(DEVICE_MODEL),
+            serial_number=facts.get(DEVICE_SERIAL_NUM),
+            sw_version=facts.get(DEVICE_FIRMWARE),
         )
 #        _LOGGER.error(f"new entity={entity} name={self._attr_name} unique_id={self.unique_id}")
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the device properties shown by this entity."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.device.async_add_key_listener(self.device_keys, self._handle_coordinator_update)
+        )
+        # Values that arrived before the entity was added do not wake it
+        self._handle_coordinator_update()
+
+    @property
+    def device_keys(self) -> tuple[str, ...]:
+        """Device properties this entity depends on."""
+        return ()
+
     @property
     def entity_type(self) -> str | None:
         """Type of entity."""
@@ -0,0 +1,110 @@
+"""Value filters for Barco Pulse sensors."""
+
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any
+
+from .const import (
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_HYSTERESIS,
+    CONF_TEMP_MIN_INTERVAL,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_HYSTERESIS,
+    DEFAULT_TEMP_MIN_INTERVAL,
+)
+
+# Filter options kept for each sensor, in set_filter_options order
+FILTER_OPTIONS = (
+    (CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+    (CONF_TEMP_HYSTERESIS, DEFAULT_TEMP_HYSTERESIS),
+    (CONF_TEMP_MIN_INTERVAL, DEFAULT_TEMP_MIN_INTERVAL),
+)
+
+
+def sensor_filter_options(options: Mapping[str, Any], sensor: str) -> tuple[float, float, float]:
+    """Deadband, hysteresis and minimum interval of one sensor.
+
+    Falls back to the settings once shared by all sensors, then to the defaults.
+    """
+    own = options.get(sensor, {})
+    return tuple(own.get(conf, options.get(conf, default)) for conf, default in FILTER_OPTIONS)
+
+
+class FilterResult(Enum):
+    """What to do with a new value."""
+
+    ACCEPT = "accept"  # publish now
+    REJECT = "reject"  # too small a change, drop it
+    DEFER = "defer"  # significant, but publish once the minimum interval has passed
+
+
+class NumericFilter:
+    """Deadband, hysteresis and rate limiting for one numeric value.
+
+    A value is only published once it is at least deadband away from the
+    last published value.  Turning back in the opposite direction needs a
+    further hysteresis on top, which keeps a value hovering around a
+    threshold from flapping.  Values are published at most once every
+    min_interval seconds; a significant value arriving sooner is held and
+    published when the interval is up.
+    """
+
+    __slots__ = (
+        "deadband",
+        "hysteresis",
+        "min_interval",
+        "_last",
+        "_direction",
+        "_last_time",
+        "_pending",
+    )
+
+    def __init__(self, deadband: float, hysteresis: float, min_interval: float) -> None:
+        """Set up filter."""
+        self.deadband = deadband
+        self.hysteresis = hysteresis
+        self.min_interval = min_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the published value, so the next one goes straight through."""
+        self._last: float | None = None
+        self._direction = 0
+        self._last_time = 0.0
+        self._pending: float | None = None
+
+    @property
+    def pending(self) -> float | None:
+        """Value held back by the minimum interval."""
+        return self._pending
+
+    def delay(self, now: float) -> float:
+        """Time until a held value may be published."""
+        return max(self._last_time + self.min_interval - now, 0.0)
+
+    def check(self, value: float, now: float) -> FilterResult:
+        """Decide what to do with a new value."""
+        last = self._last
+        if last is not None:
+            delta = value - last
+            direction = (delta > 0) - (delta < 0)
+            threshold = self.deadband
+            if self._direction and direction != self._direction:
+                threshold += self.hysteresis
+            if abs(delta) < threshold or not direction:
+                # Back within the band, so anything held is no longer worth sending
+                self._pending = None
+                return FilterResult.REJECT
+            if now - self._last_time < self.min_interval:
+                self._pending = value
+                return FilterResult.DEFER
+        self.publish(value, now)
+        return FilterResult.ACCEPT
+
+    def publish(self, value: float, now: float) -> None:
+        """Record a value as published."""
+        if self._last is not None and value != self._last:
+            self._direction = 1 if value > self._last else -1
+        self._last = value
+        self._last_time = now
+        self._pending = None
@@ -0,0 +1,181 @@
+"""Shared scheduling for all Barco Pulse projectors."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import logging
+import math
+import socket
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    BARCO_CONNECT_STAGGER,
+    BARCO_MAX_CONCURRENT_CONNECTS,
+    BARCO_TIMER_RESOLUTION,
+    BARCO_WOL_ADDRESS,
+    BARCO_WOL_PORT,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .device import BarcoDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Timers rounded up to fixed slots, so many devices share one wakeup."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float) -> None:
+        """Set up wheel."""
+        self._loop = loop
+        self._resolution = resolution
+        self._slots: dict[int, list[list[Callable[[], None] | None]]] = {}
+        self._handles: dict[int, asyncio.TimerHandle] = {}
+
+    @property
+    def pending_slots(self) -> int:
+        """Number of loop timers the wheel currently holds."""
+        return len(self._handles)
+
+    def call_later(self, delay: float, cb: Callable[[], None]) -> Callable[[], None]:
+        """Run cb no sooner than delay seconds from now and return a canceller.
+
+        Delays shorter than a slot get a loop timer of their own, rather
+        than being rounded up to several times their length.
+        """
+        if delay < self._resolution:
+            return self._loop.call_later(delay, cb).cancel
+        slot = math.ceil((self._loop.time() + delay) / self._resolution)
+        entries = self._slots.get(slot)
+        if entries is None:
+            entries = self._slots[slot] = []
+            self._handles[slot] = self._loop.call_at(slot * self._resolution, self._fire, slot)
+        entry: list[Callable[[], None] | None] = [cb]
+        entries.append(entry)
+
+        def cancel() -> None:
+            entry[0] = None
+
+        return cancel
+
+    def _fire(self, slot: int) -> None:
+        """Run everything due in a slot."""
+        self._handles.pop(slot, None)
+        for (cb,) in self._slots.pop(slot, ()):
+            if cb is not None:
+                try:
+                    cb()
+                except Exception:
+                    _LOGGER.exception("Error in timer callback")
+
+    def close(self) -> None:
+        """Drop all timers."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._slots.clear()
+
+
+class BarcoHub:
+    """Resources shared by every configured projector.
+
+    The hub spreads reconnects out so that a network blip does not make
+    every projector reconnect at once, runs all device timers off one
+    timer wheel and sends wake-on-lan packets for every projector from
+    one broadcast socket.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Set up hub."""
+        self._hass = hass
+        self._devices: dict[str, BarcoDevice] = {}
+        self._wheel = TimerWheel(hass.loop, BARCO_TIMER_RESOLUTION)
+        self._connect_slots = asyncio.Semaphore(BARCO_MAX_CONCURRENT_CONNECTS)
+        self._next_connect = 0.0
+        self._wol_transport: asyncio.DatagramTransport | None = None
+        self._wol_lock = asyncio.Lock()
+
+    @property
+    def devices(self) -> list[BarcoDevice]:
+        """Registered devices."""
+        return list(self._devices.values())
+
+    @property
+    def wheel(self) -> TimerWheel:
+        """Shared timer wheel."""
+        return self._wheel
+
+    @callback
+    def register(self, device: BarcoDevice) -> None:
+        """Add a device."""
+        self._devices[device.device_id] = device
+
+    @callback
+    def unregister(self, device: BarcoDevice) -> bool:
+        """Remove a device, returning True once no devices are left."""
+        self._devices.pop(device.device_id, None)
+        return not self._devices
+
+    def close(self) -> None:
+        """Release shared resources."""
+        self._wheel.close()
+        if self._wol_transport is not None:
+            self._wol_transport.close()
+            self._wol_transport = None
+
+    @asynccontextmanager
+    async def async_connect_slot(self) -> AsyncIterator[None]:
+        """Limit and stagger connection attempts across all devices."""
+        async with self._connect_slots:
+            now = self._hass.loop.time()
+            start = max(now, self._next_connect)
+            self._next_connect = start + BARCO_CONNECT_STAGGER
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+    async def async_wake(self, mac: str) -> None:
+        """Broadcast a wake-on-lan magic packet."""
+        transport = self._wol_transport
+        if transport is None or transport.is_closing():
+            async with self._wol_lock:
+                if self._wol_transport is None or self._wol_transport.is_closing():
+                    self._wol_transport, _ = await self._hass.loop.create_datagram_endpoint(
+                        asyncio.DatagramProtocol,
+                        family=socket.AF_INET,
+                        allow_broadcast=True,
+                    )
+                transport = self._wol_transport
+        _LOGGER.debug("Sending wake-on-lan to %s", mac)
+        transport.sendto(magic_packet(mac), (BARCO_WOL_ADDRESS, BARCO_WOL_PORT))
+
+
+def magic_packet(mac: str) -> bytes:
+    """Build the wake-on-lan packet for a MAC address in any common notation."""
+    address = bytes.fromhex("".join(c for c in mac if c not in ":-."))
+    if len(address) != 6:
+        raise ValueError(f"Incorrect MAC address: {mac}")
+    return b"\xff" * 6 + address * 16
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> BarcoHub:
+    """Return the hub, creating it on first use."""
+    hub = hass.data.get(DOMAIN)
+    if hub is None:
+        hub = hass.data[DOMAIN] = BarcoHub(hass)
+    return hub
+
+
+@callback
+def async_release_hub(hass: HomeAssistant, device: BarcoDevice) -> None:
+    """Unregister a device and drop the hub once it is unused."""
+    hub: BarcoHub | None = hass.data.get(DOMAIN)
+    if hub is not None and hub.unregister(device):
+        hub.close()
+        hass.data.pop(DOMAIN)
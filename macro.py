@@ -0,0 +1,90 @@
+"""Command sequences sent to a Barco Pulse projector as one batch."""
+
+import asyncio
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+STEP_CONFIRMED = "confirmed"  # the property reported the value that was set
+STEP_ACKNOWLEDGED = "acknowledged"  # a method call that was accepted
+STEP_UNCONFIRMED = "unconfirmed"  # accepted, but the value did not show up in time
+STEP_FAILED = "failed"  # rejected by the projector
+STEP_NO_REPLY = "no_reply"
+
+
+@dataclass(slots=True)
+class MacroStep:
+    """One command in a macro, with its timing."""
+
+    method: str
+    params: Any = "[]"
+    # For property.set, the property whose change confirms the step
+    prop: str | None = None
+    value: Any = None
+    acked: float | None = None
+    confirmed: float | None = None
+    error: str | None = None
+
+    @classmethod
+    def set_property(cls, name: str, value: Any) -> "MacroStep":
+        """Step that sets a property and waits for it to change."""
+        return cls("property.set", {"property": name, "value": value}, name, value)
+
+    def ack(self, fut: asyncio.Future) -> None:
+        """Record the reply to the step."""
+        if fut.cancelled():
+            return
+        self.acked = time.monotonic()
+        if (exc := fut.exception()) is not None:
+            self.error = str(exc) or type(exc).__name__
+
+    def confirm(self, fut: asyncio.Future) -> None:
+        """Record the property change confirming the step."""
+        if not fut.cancelled():
+            self.confirmed = fut.result()
+
+    @property
+    def status(self) -> str:
+        """How far the step got."""
+        if self.error is not None:
+            return STEP_FAILED
+        if self.acked is None:
+            return STEP_NO_REPLY
+        if self.prop is None:
+            return STEP_ACKNOWLEDGED
+        return STEP_CONFIRMED if self.confirmed is not None else STEP_UNCONFIRMED
+
+    def as_dict(self, start: float) -> dict[str, Any]:
+        """Step outcome as plain data, with times in milliseconds from the start."""
+        return {
+            "method": self.method,
+            "property": self.prop,
+            "status": self.status,
+            "ack_ms": None if self.acked is None else (self.acked - start) * 1000,
+            "confirm_ms": None if self.confirmed is None else (self.confirmed - start) * 1000,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class MacroResult:
+    """Outcome of a macro."""
+
+    steps: list[MacroStep]
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every step was acknowledged or confirmed."""
+        return all(step.status in (STEP_CONFIRMED, STEP_ACKNOWLEDGED) for step in self.steps)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Macro outcome as plain data."""
+        return {
+            "complete": self.complete,
+            "total_ms": None
+            if self.finished is None
+            else (self.finished - self.started) * 1000,
+            "steps": [step.as_dict(self.started) for step in self.steps],
+        }
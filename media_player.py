@@ -14,6 +14,13 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import BarcoConfigEntry, BarcoCoordinator
+from .properties import (
+    DEVICE_AVAILABLE,
+    DEVICE_INPUT_SOURCE,
+    DEVICE_INPUT_SOURCE_LIST,
+    DEVICE_PENDING,
+    DEVICE_SYSTEM_TARGETSTATE,
+)
 from .entity import BarcoEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,10 +54,29 @@ class BarcoMediaPlayer(MediaPlayerEntity, BarcoEntity):
         """Get going."""
         super().__init__(coord, DESC)
 
+    @property
+    def device_keys(self) -> tuple[str, ...]:
+        """Device properties this entity depends on."""
+        return (
+            DEVICE_AVAILABLE,
+            DEVICE_SYSTEM_TARGETSTATE,
+            DEVICE_INPUT_SOURCE,
+            DEVICE_INPUT_SOURCE_LIST,
+            DEVICE_PENDING,
+        )
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while power or source is waiting for the projector to confirm."""
+        device = self.coordinator.device
+        return device.is_pending(DEVICE_SYSTEM_TARGETSTATE) or device.is_pending(
+            DEVICE_INPUT_SOURCE
+        )
+
     @property
     def available(self) -> bool:
-        """Is device online."""
-        return self.coordinator.device.online
+        """Is the projector answering, or being woken."""
+        return self.coordinator.device.available
 
     @property
     def is_on(self) -> bool:
@@ -87,4 +113,4 @@ class BarcoMediaPlayer(MediaPlayerEntity, BarcoEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
@@ -0,0 +1,277 @@
+"""Pulse property registry.
+
+Every projector property the integration reads is declared once here,
+with how its value is stored, whether it is subscribed to, when it is
+polled and which entities show it.  The device's subscription list and
+notification dispatch table and the sensor platforms' entity
+descriptions are all generated from the registry.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers.entity import EntityDescription
+
+DEVICE_SYSTEM_TARGETSTATE = "system.targetstate"
+DEVICE_SYSTEM_STATE = "system.state"
+DEVICE_INLET_T = "environment.temperature.inlet.value"
+DEVICE_OUTLET_T = "environment.temperature.outlet.value"
+DEVICE_LASER_STATUS = "illumination.sources.laser.status"
+DEVICE_LASER_ON = "laser"
+DEVICE_HDMI_SIGNAL = "image.connector.hdmi.detectedsignal"
+DEVICE_OUTPUT_SIZE = "image.resolution.processing.size"
+DEVICE_INPUT_ACTIVE = "input_active"
+DEVICE_INPUT_SIGNAL = "input_signal"
+DEVICE_OUTPUT_HRES = "output_hres"
+DEVICE_OUTPUT_VRES = "output_vres"
+DEVICE_OUTPUT_RES = "output_res"
+DEVICE_MAINBOARD_T = "environment.temperature.mainboard.value"
+DEVICE_ILLUM_STATE = "illumination.state"
+DEVICE_ILLUM_ON = "illumination"
+DEVICE_MODEL = "system.modelname"
+DEVICE_SERIAL_NUM = "system.serialnumber"
+DEVICE_FIRMWARE = "system.firmwareversion"
+DEVICE_INPUT_SOURCE = "image.window.main.source"
+DEVICE_INPUT_SOURCE_LIST = "image.source.list"
+DEVICE_ONLINE = "online"
+# Subscribed, or asleep but answering so it can be woken
+DEVICE_AVAILABLE = "available"
+# Keys currently showing an optimistic value
+DEVICE_PENDING = "pending"
+
+type Transform = Callable[[Any], tuple[tuple[str, Any], ...]]
+
+
+class PollTier(IntEnum):
+    """When a property is read outright rather than waited for."""
+
+    NEVER = 0  # only read while probing the connection
+    CONNECT = 1  # read once after connecting, pushed after that if subscribed
+    REFRESH = 2  # also read on every coordinator refresh
+
+
+@dataclass(frozen=True, kw_only=True)
+class BarcoSensorEntityDescription(SensorEntityDescription):
+    """Sensor showing one device key."""
+
+    device_key: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class BarcoBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Binary sensor showing one device key."""
+
+    device_key: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class PulseProperty:
+    """One Pulse API property."""
+
+    name: str
+    # Turns a value into the device keys to store; stored as is under name if None
+    transform: Transform | None = None
+    # Device keys the transform writes
+    keys: tuple[str, ...] = ()
+    subscribe: bool = True
+    # Subscribed to even when no entity shows it
+    required: bool = False
+    # Numeric value passed through the deadband/hysteresis filter
+    filtered: bool = False
+    poll: PollTier = PollTier.CONNECT
+    # Only changes with the projector or its firmware; kept while
+    # disconnected and cached across restarts
+    static: bool = False
+    # Writes arriving while one is in flight collapse to the last value
+    coalesce: bool = False
+    entities: tuple[EntityDescription, ...] = ()
+
+    @property
+    def store_keys(self) -> tuple[str, ...]:
+        """Device keys this property ends up in."""
+        return self.keys or (self.name,)
+
+
+def _fahrenheit(key: str) -> Transform:
+    """Store a Celsius temperature in Fahrenheit."""
+    return lambda v: ((key, (v / 5 * 9) + 32),)
+
+
+def _on_flag(key: str, raw_key: str | None = None) -> Transform:
+    """Store an "On"/"Off" value as a boolean, and optionally as is."""
+    if raw_key is None:
+        return lambda v: ((key, v == "On"),)
+    return lambda v: ((key, v == "On"), (raw_key, v))
+
+
+def _hdmi_signal(v: Any) -> tuple[tuple[str, Any], ...]:
+    return ((DEVICE_INPUT_ACTIVE, v["active"]), (DEVICE_INPUT_SIGNAL, v["name"]))
+
+
+def _output_size(v: Any) -> tuple[tuple[str, Any], ...]:
+    pixels = v["pixels"]
+    lines = v["lines"]
+    return (
+        (DEVICE_OUTPUT_HRES, pixels),
+        (DEVICE_OUTPUT_VRES, lines),
+        (DEVICE_OUTPUT_RES, f"{pixels}x{lines}"),
+    )
+
+
+def _temperature(key: str, device_key: str) -> BarcoSensorEntityDescription:
+    return BarcoSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_key=device_key,
+    )
+
+
+def _enum(key: str, device_key: str) -> BarcoSensorEntityDescription:
+    return BarcoSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        device_class=SensorDeviceClass.ENUM,
+        device_key=device_key,
+    )
+
+
+PROPERTIES = (
+    PulseProperty(name=DEVICE_MODEL, subscribe=False, poll=PollTier.NEVER, static=True),
+    PulseProperty(name=DEVICE_SERIAL_NUM, subscribe=False, poll=PollTier.NEVER, static=True),
+    PulseProperty(name=DEVICE_FIRMWARE, subscribe=False, poll=PollTier.NEVER, static=True),
+    PulseProperty(
+        name=DEVICE_SYSTEM_TARGETSTATE,
+        required=True,
+        poll=PollTier.REFRESH,
+        entities=(_enum("system_targetstate", DEVICE_SYSTEM_TARGETSTATE),),
+    ),
+    PulseProperty(
+        name=DEVICE_SYSTEM_STATE,
+        required=True,
+        poll=PollTier.REFRESH,
+        entities=(_enum("system_state", DEVICE_SYSTEM_STATE),),
+    ),
+    PulseProperty(
+        name=DEVICE_INLET_T,
+        transform=_fahrenheit(DEVICE_INLET_T),
+        filtered=True,
+        entities=(_temperature("inlet_temp", DEVICE_INLET_T),),
+    ),
+    PulseProperty(
+        name=DEVICE_OUTLET_T,
+        transform=_fahrenheit(DEVICE_OUTLET_T),
+        filtered=True,
+        entities=(_temperature("outlet_temp", DEVICE_OUTLET_T),),
+    ),
+    PulseProperty(
+        name=DEVICE_MAINBOARD_T,
+        transform=_fahrenheit(DEVICE_MAINBOARD_T),
+        filtered=True,
+        entities=(_temperature("mainboard_temp", DEVICE_MAINBOARD_T),),
+    ),
+    PulseProperty(
+        name=DEVICE_LASER_STATUS,
+        transform=_on_flag(DEVICE_LASER_ON, DEVICE_LASER_STATUS),
+        keys=(DEVICE_LASER_ON, DEVICE_LASER_STATUS),
+        entities=(
+            _enum("laser_state", DEVICE_LASER_STATUS),
+            BarcoBinarySensorEntityDescription(
+                key="laser", translation_key="laser", device_key=DEVICE_LASER_ON
+            ),
+        ),
+    ),
+    PulseProperty(
+        name=DEVICE_HDMI_SIGNAL,
+        transform=_hdmi_signal,
+        keys=(DEVICE_INPUT_ACTIVE, DEVICE_INPUT_SIGNAL),
+        entities=(_enum("input_signal", DEVICE_INPUT_SIGNAL),),
+    ),
+    PulseProperty(
+        name=DEVICE_OUTPUT_SIZE,
+        transform=_output_size,
+        keys=(DEVICE_OUTPUT_HRES, DEVICE_OUTPUT_VRES, DEVICE_OUTPUT_RES),
+        entities=(
+            BarcoSensorEntityDescription(
+                key="output_hres",
+                translation_key="output_hres",
+                device_class="pixels",
+                state_class=SensorStateClass.MEASUREMENT,
+                device_key=DEVICE_OUTPUT_HRES,
+            ),
+            BarcoSensorEntityDescription(
+                key="output_vres",
+                translation_key="output_vres",
+                device_class="lines",
+                state_class=SensorStateClass.MEASUREMENT,
+                device_key=DEVICE_OUTPUT_VRES,
+            ),
+            _enum("output_res", DEVICE_OUTPUT_RES),
+        ),
+    ),
+    PulseProperty(
+        name=DEVICE_ILLUM_STATE,
+        transform=_on_flag(DEVICE_ILLUM_ON),
+        keys=(DEVICE_ILLUM_ON,),
+        entities=(
+            BarcoBinarySensorEntityDescription(
+                key="illumination", translation_key="illumination", device_key=DEVICE_ILLUM_ON
+            ),
+        ),
+    ),
+    PulseProperty(name=DEVICE_INPUT_SOURCE, coalesce=True),
+)
+
+# Generated from the registry
+TRANSFORMS: dict[str, Transform] = {
+    prop.name: prop.transform for prop in PROPERTIES if prop.transform is not None
+}
+FILTERED_KEYS = tuple(key for prop in PROPERTIES if prop.filtered for key in prop.store_keys)
+# Sensor key, as used for its filter options, to the device key it shows
+FILTERED_SENSORS = {
+    desc.key: desc.device_key
+    for prop in PROPERTIES
+    if prop.filtered
+    for desc in prop.entities
+    if isinstance(desc, BarcoSensorEntityDescription)
+}
+PROPERTY_BY_KEY = {key: prop.name for prop in PROPERTIES for key in prop.store_keys}
+PROPERTY_SUBS = [prop.name for prop in PROPERTIES if prop.subscribe]
+PROPERTY_REQUIRED = [prop.name for prop in PROPERTIES if prop.subscribe and prop.required]
+PROPERTY_INIT = [prop.name for prop in PROPERTIES if prop.poll >= PollTier.CONNECT]
+PROPERTY_POLL = [prop.name for prop in PROPERTIES if prop.poll >= PollTier.REFRESH]
+COALESCED_PROPERTIES = frozenset(prop.name for prop in PROPERTIES if prop.coalesce)
+STATE_KEYS = (
+    DEVICE_ONLINE,
+    DEVICE_AVAILABLE,
+    DEVICE_PENDING,
+    DEVICE_INPUT_SOURCE_LIST,
+    *(key for prop in PROPERTIES for key in prop.store_keys),
+)
+STATIC_KEYS = (
+    DEVICE_INPUT_SOURCE_LIST,
+    *(key for prop in PROPERTIES if prop.static for key in prop.store_keys),
+)
+SENSOR_DESCRIPTIONS = tuple(
+    desc
+    for prop in PROPERTIES
+    for desc in prop.entities
+    if isinstance(desc, BarcoSensorEntityDescription)
+)
+BINARY_SENSOR_DESCRIPTIONS = tuple(
+    desc
+    for prop in PROPERTIES
+    for desc in prop.entities
+    if isinstance(desc, BarcoBinarySensorEntityDescription)
+)
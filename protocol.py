@@ -0,0 +1,192 @@
+"""Barco Pulse JSON-RPC wire protocol."""
+
+import json
+import logging
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+
+    def loads(data: bytes | bytearray | memoryview) -> Any:
+        """Decode JSON from a bytes-like object."""
+        return json.loads(str(data, "utf-8"))
+
+    def dumps(obj: Any) -> bytes:
+        """Encode JSON to bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def encode_request(method: str, params: Any, req_id: int) -> bytes:
+    """Encode one JSON-RPC request."""
+    return dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": req_id})
+
+
+def encode_batch(parts: list[bytes]) -> bytes:
+    """Join encoded requests into one write, as a batch if there are several."""
+    if len(parts) == 1:
+        return parts[0]
+    return b"[" + b",".join(parts) + b"]"
+
+
+class RequestTemplate(tuple):
+    """A (method, params) request encoded once, with only the id filled in per call.
+
+    Unpacks like a plain (method, params) tuple, so it can go anywhere a
+    request can.
+    """
+
+    def __new__(cls, method: str, params: Any) -> "RequestTemplate":
+        """Encode everything but the id."""
+        self = super().__new__(cls, (method, params))
+        head = encode_request(method, params, 0)
+        # The id is the last member, so everything before its value is fixed
+        self._prefix = head[: head.rindex(b"0")]
+        return self
+
+    @property
+    def method(self) -> str:
+        """Method name."""
+        return self[0]
+
+    def encode(self, req_id: int) -> bytes:
+        """Encode the request with the given id."""
+        return b"%s%d}" % (self._prefix, req_id)
+
+# Largest single message we are prepared to buffer before giving up on it.
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+# Bytes that can change the framing state.  Everything else is skipped by the
+# regex engine instead of being walked one byte at a time in Python.
+_SPECIAL = re.compile(rb'[{}\[\]"\\]')
+_OPEN = (ord("{"), ord("["))
+_CLOSE = (ord("}"), ord("]"))
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+
+
+class JsonRpcFramer:
+    """Incrementally split a TCP byte stream into complete JSON messages.
+
+    The Pulse API does not delimit messages, so message boundaries are found
+    by tracking object/array depth, taking care to ignore brackets inside
+    strings.  The scan state survives between reads so a message split across
+    several reads is only scanned once, and partial tails are kept until the
+    rest arrives.
+    """
+
+    def __init__(self, max_size: int = MAX_MESSAGE_SIZE) -> None:
+        """Set up framer."""
+        self._max_size = max_size
+        self._buf = bytearray()
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+
+    def reset(self) -> None:
+        """Discard any buffered data."""
+        self._buf.clear()
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+
+    @property
+    def buffered(self) -> int:
+        """Number of bytes waiting for the rest of a message."""
+        return len(self._buf)
+
+    def decode(self, data: bytes) -> list[Any]:
+        """Add data from the socket and return every complete message, decoded.
+
+        Messages are parsed straight out of the receive buffer, without
+        copying each one out first.  Messages that are not valid JSON are
+        logged and skipped.
+        """
+        spans, consumed = self._scan(data)
+        messages = []
+        if spans:
+            with memoryview(self._buf) as view:
+                for start, end in spans:
+                    try:
+                        messages.append(loads(view[start:end]))
+                    except ValueError as exc:
+                        _LOGGER.error("Decode error: %s", exc)
+        self._compact(consumed)
+        return messages
+
+    def _scan(self, data: bytes) -> tuple[list[tuple[int, int]], int]:
+        """Buffer data and find complete messages.
+
+        Returns the start and end of each message in the buffer and how many
+        bytes at the front of the buffer can be dropped once they are read.
+        """
+        buf = self._buf
+        buf += data
+        pos = self._pos
+        start = self._start
+        depth = self._depth
+        in_string = self._in_string
+        consumed = 0
+        spans = []
+        search = _SPECIAL.search
+
+        while (m := search(buf, pos)) is not None:
+            i = m.start()
+            c = buf[i]
+            pos = i + 1
+            if in_string:
+                if c == _BACKSLASH:
+                    # Skip the escaped byte, even if it has not arrived yet
+                    pos += 1
+                elif c == _QUOTE:
+                    in_string = False
+            elif c == _QUOTE:
+                if depth:
+                    in_string = True
+            elif c in _OPEN:
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif c in _CLOSE and depth:
+                depth -= 1
+                if depth == 0:
+                    spans.append((start, pos))
+                    consumed = pos
+                    start = -1
+
+        # Nothing special is left between pos and the end of the buffer
+        pos = max(pos, len(buf))
+        if depth == 0:
+            # No message is pending, so whatever is left is noise
+            consumed = len(buf)
+        elif len(buf) - start > self._max_size:
+            _LOGGER.error("Discarding oversized message (%d bytes)", len(buf) - start)
+            consumed = len(buf)
+            start = -1
+            depth = 0
+            in_string = False
+
+        self._pos = pos
+        self._start = start
+        self._depth = depth
+        self._in_string = in_string
+        return spans, consumed
+
+    def _compact(self, consumed: int) -> None:
+        """Drop bytes that have been fully read."""
+        if consumed:
+            del self._buf[:consumed]
+            self._pos -= consumed
+            if self._start >= 0:
+                self._start -= consumed
@@ -4,15 +4,35 @@ from collections.abc import Iterable
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.remote import RemoteEntity, RemoteEntityDescription
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import BARCO_MACRO_TIMEOUT
 from .coordinator import BarcoConfigEntry, BarcoCoordinator
+from .macro import MacroStep
+from .properties import DEVICE_PENDING, DEVICE_SYSTEM_TARGETSTATE
 from .entity import BarcoEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_RUN_MACRO = "run_macro"
+ATTR_STEPS = "steps"
+ATTR_TIMEOUT = "timeout"
+
+MACRO_STEP_SCHEMA = vol.Any(
+    vol.Schema({vol.Required("property"): cv.string, vol.Required("value"): object}),
+    vol.Schema(
+        {
+            vol.Required("method"): cv.string,
+            vol.Optional("params", default="[]"): vol.Any(dict, list, "[]"),
+        }
+    ),
+)
+
 REMOTE_DESC = RemoteEntityDescription(
     key="projector",
     translation_key="Projector"
@@ -29,6 +49,21 @@ async def async_setup_entry(
 
     async_add_entities([BarcoRemote(coord)])
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_RUN_MACRO,
+        {
+            vol.Required(ATTR_STEPS): vol.All(
+                cv.ensure_list, [MACRO_STEP_SCHEMA], vol.Length(min=1)
+            ),
+            vol.Optional(ATTR_TIMEOUT, default=BARCO_MACRO_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=300)
+            ),
+        },
+        "async_run_macro",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
 
 class BarcoRemote(RemoteEntity, BarcoEntity):
     """Screen as a Remote."""
@@ -37,6 +72,16 @@ class BarcoRemote(RemoteEntity, BarcoEntity):
         """Get going."""
         super().__init__(coord, REMOTE_DESC)
 
+    @property
+    def device_keys(self) -> tuple[str, ...]:
+        """Device properties this entity depends on."""
+        return (DEVICE_SYSTEM_TARGETSTATE, DEVICE_PENDING)
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while power is waiting for the projector to confirm."""
+        return self.coordinator.device.is_pending(DEVICE_SYSTEM_TARGETSTATE)
+
     @property
     def is_on(self) -> bool:
         """Return True if entity is on."""
@@ -57,10 +102,22 @@ class BarcoRemote(RemoteEntity, BarcoEntity):
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send command to device."""
-        for c in command:
-            await self.coordinator.device.send_command(c, "[]")
+        await self.coordinator.device.send_commands([(c, "[]") for c in command])
+
+    async def async_run_macro(
+        self, steps: list[dict[str, Any]], timeout: float
+    ) -> ServiceResponse:
+        """Run a sequence of commands as one batch and report how each step went."""
+        macro = [
+            MacroStep.set_property(step["property"], step["value"])
+            if "property" in step
+            else MacroStep(step["method"], step["params"])
+            for step in steps
+        ]
+        result = await self.coordinator.device.run_macro(macro, timeout)
+        return result.as_dict()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
@@ -0,0 +1,127 @@
+"""Command scheduling for Barco Pulse devices."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import heapq
+import itertools
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower numbers are sent first
+PRIORITY_URGENT = 0  # power and source changes
+PRIORITY_USER = 1  # remote commands
+PRIORITY_POLL = 2  # background polling
+
+
+class CommandScheduler:
+    """Send queued commands to one device, most urgent first.
+
+    Each queued entry is a batch of one or more requests that is written in
+    one go.  Batches are paced so that at least min_interval seconds pass
+    between two writes, and the next batch is not written until the
+    socket's write buffer has drained.  Replies are not waited for, so
+    commands still overlap on the wire.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        send_batch: Callable[[list[tuple[str, Any]]], list[asyncio.Future]],
+        drain: Callable[[], Awaitable[None]],
+        min_interval: float,
+    ) -> None:
+        """Set up scheduler."""
+        self._loop = loop
+        self._send_batch = send_batch
+        self._drain = drain
+        self._min_interval = min_interval
+        self._heap: list[tuple[int, int, list[tuple[str, Any]], list[asyncio.Future]]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._last_sent = -min_interval
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of batches waiting to be sent."""
+        return len(self._heap)
+
+    def submit(self, requests: list[tuple[str, Any]], priority: int) -> list[asyncio.Future]:
+        """Queue a batch of commands and return a future for each reply."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        futs = [self._loop.create_future() for _ in requests]
+        heapq.heappush(self._heap, (priority, next(self._seq), requests, futs))
+        self._wakeup.set()
+        return futs
+
+    def clear(self, exc: Exception) -> None:
+        """Fail every queued command."""
+        heap = self._heap
+        self._heap = []
+        for *_, futs in heap:
+            for fut in futs:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+    async def stop(self) -> None:
+        """Stop the worker and fail anything still queued."""
+        self.clear(ConnectionError("Scheduler stopped"))
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Send commands as pacing allows."""
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # Wait before picking the command so that anything more urgent
+            # arriving in the meantime goes first.
+            delay = self._last_sent + self._min_interval - self._loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            priority, _, requests, futs = heapq.heappop(self._heap)
+            if all(fut.done() for fut in futs):
+                continue
+            try:
+                reqs = self._send_batch(requests)
+            except Exception as err:
+                for fut in futs:
+                    if not fut.done():
+                        fut.set_exception(err)
+                continue
+            self._last_sent = self._loop.time()
+            _LOGGER.debug(
+                "Sent %d request(s) (priority %d, %d queued)", len(reqs), priority, len(self._heap)
+            )
+            for req, fut in zip(reqs, futs):
+                req.add_done_callback(lambda r, fut=fut: _copy_result(r, fut))
+                fut.add_done_callback(lambda f, req=req: req.cancel() if f.cancelled() else None)
+            try:
+                await self._drain()
+            except ConnectionError as err:
+                _LOGGER.debug("Drain failed: %s", err)
+
+
+def _copy_result(src: asyncio.Future, dst: asyncio.Future) -> None:
+    """Pass the outcome of one future on to another."""
+    if dst.done():
+        return
+    if src.cancelled():
+        dst.cancel()
+    elif (exc := src.exception()) is not None:
+        dst.set_exception(exc)
+    else:
+        dst.set_result(src.result())
@@ -1,5 +1,7 @@
 """Platform for sensor integration."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 
 from homeassistant.components.sensor import (
@@ -8,113 +10,99 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import BarcoConfigEntry
-from .device import (
-    DEVICE_INLET_T,
-    DEVICE_INPUT_ACTIVE,
-    DEVICE_INPUT_SIGNAL,
-    DEVICE_LASER_STATUS,
-    DEVICE_MAINBOARD_T,
-    DEVICE_OUTLET_T,
-    DEVICE_OUTPUT_HRES,
-    DEVICE_OUTPUT_RES,
-    DEVICE_OUTPUT_VRES,
-    DEVICE_SYSTEM_STATE,
-    DEVICE_SYSTEM_TARGETSTATE,
-)
 from .entity import BarcoEntity
+from .properties import SENSOR_DESCRIPTIONS, BarcoSensorEntityDescription
+from .stats import DeviceStats
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_INLET_T = "inlet_temp"
-SENSOR_OUTLET_T = "outlet_temp"
-SENSOR_MAINBOARD_T = "mainboard_temp"
-SENSOR_INPUT_ACTIVE = "input_active"
-SENSOR_INPUT_SIGNAL = "input_signal"
-SENSOR_OUTPUT_RES = "output_res"
-SENSOR_OUTPUT_HRES = "output_hres"
-SENSOR_OUTPUT_VRES = "output_vres"
-SENSOR_LASER_STATUS = "laser_state"
-SENSOR_SYSTEM_STATE = "system_state"
-SENSOR_SYSTEM_TARGETSTATE = "system_targetstate"
-
-BARCO_SENSOR_MAP = {
-    SENSOR_INLET_T: DEVICE_INLET_T,
-    SENSOR_OUTLET_T: DEVICE_OUTLET_T,
-    SENSOR_MAINBOARD_T: DEVICE_MAINBOARD_T,
-    SENSOR_INPUT_ACTIVE: DEVICE_INPUT_ACTIVE,
-    SENSOR_INPUT_SIGNAL: DEVICE_INPUT_SIGNAL,
-    SENSOR_LASER_STATUS: DEVICE_LASER_STATUS,
-    SENSOR_OUTPUT_VRES: DEVICE_OUTPUT_VRES,
-    SENSOR_OUTPUT_HRES: DEVICE_OUTPUT_HRES,
-    SENSOR_OUTPUT_RES: DEVICE_OUTPUT_RES,
-    SENSOR_SYSTEM_STATE: DEVICE_SYSTEM_STATE,
-    SENSOR_SYSTEM_TARGETSTATE: DEVICE_SYSTEM_TARGETSTATE,
-}
-
-SENSOR_DESCRIPTIONS = (
-    SensorEntityDescription(
-        key=SENSOR_INLET_T,
-        translation_key=SENSOR_INLET_T,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT
-    ),
-    SensorEntityDescription(
-        key=SENSOR_MAINBOARD_T,
-        translation_key=SENSOR_MAINBOARD_T,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT
+SENSOR_LINK_RTT = "link_rtt"
+SENSOR_HANDSHAKE_TIME = "handshake_time"
+SENSOR_CLICK_TO_LIGHT = "click_to_light"
+SENSOR_NOTIFICATION_RATE = "notification_rate"
+SENSOR_RECONNECTS = "reconnects"
+SENSOR_MAX_PENDING_REQUESTS = "max_pending_requests"
+SENSOR_BYTES_IN = "bytes_in"
+SENSOR_BYTES_OUT = "bytes_out"
+
+
+@dataclass(frozen=True, kw_only=True)
+class BarcoStatsSensorEntityDescription(SensorEntityDescription):
+    """Link statistics sensor description."""
+
+    value_fn: Callable[[DeviceStats], float | int | None]
+
+
+STATS_DESCRIPTIONS = (
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_LINK_RTT,
+        translation_key=SENSOR_LINK_RTT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.rtt_mean,
     ),
-    SensorEntityDescription(
-        key=SENSOR_INPUT_SIGNAL,
-        translation_key=SENSOR_INPUT_SIGNAL,
-        device_class=SensorDeviceClass.ENUM,
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_HANDSHAKE_TIME,
+        translation_key=SENSOR_HANDSHAKE_TIME,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.last_handshake,
     ),
-    SensorEntityDescription(
-        key=SENSOR_OUTLET_T,
-        translation_key=SENSOR_OUTLET_T,
-        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_CLICK_TO_LIGHT,
+        translation_key=SENSOR_CLICK_TO_LIGHT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.click_to_light,
     ),
-    SensorEntityDescription(
-        key=SENSOR_OUTPUT_HRES,
-        translation_key=SENSOR_OUTPUT_HRES,
-        device_class="pixels",
-        state_class=SensorStateClass.MEASUREMENT
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_NOTIFICATION_RATE,
+        translation_key=SENSOR_NOTIFICATION_RATE,
+        native_unit_of_measurement="notifications/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.notification_rate,
     ),
-    SensorEntityDescription(
-        key=SENSOR_OUTPUT_VRES,
-        translation_key=SENSOR_OUTPUT_VRES,
-        device_class="lines",
-        state_class=SensorStateClass.MEASUREMENT
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_RECONNECTS,
+        translation_key=SENSOR_RECONNECTS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.reconnects,
     ),
-    SensorEntityDescription(
-        key=SENSOR_OUTPUT_RES,
-        translation_key=SENSOR_OUTPUT_RES,
-        device_class=SensorDeviceClass.ENUM,
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_MAX_PENDING_REQUESTS,
+        translation_key=SENSOR_MAX_PENDING_REQUESTS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.max_pending,
     ),
-    SensorEntityDescription(
-        key=SENSOR_LASER_STATUS,
-        translation_key=SENSOR_LASER_STATUS,
-        device_class=SensorDeviceClass.ENUM,
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_BYTES_IN,
+        translation_key=SENSOR_BYTES_IN,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.bytes_in,
     ),
-    SensorEntityDescription(
-        key=SENSOR_SYSTEM_STATE,
-        translation_key=SENSOR_SYSTEM_STATE,
-        device_class=SensorDeviceClass.ENUM,
+    BarcoStatsSensorEntityDescription(
+        key=SENSOR_BYTES_OUT,
+        translation_key=SENSOR_BYTES_OUT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.bytes_out,
     ),
-    SensorEntityDescription(
-        key=SENSOR_SYSTEM_TARGETSTATE,
-        translation_key=SENSOR_SYSTEM_TARGETSTATE,
-        device_class=SensorDeviceClass.ENUM,
-    )
 )
 
 async def async_setup_entry(hass: HomeAssistant,
@@ -123,22 +111,55 @@ async def async_setup_entry(hass: HomeAssistant,
     """Add sensors for passed config_entry in HA."""
     coord = config_entry.runtime_data
     new_entities = [BarcoSensor(coord, desc) for desc in SENSOR_DESCRIPTIONS]
+    new_entities += [BarcoStatsSensor(coord, desc) for desc in STATS_DESCRIPTIONS]
     if new_entities:
         async_add_entities(new_entities)
 
 class BarcoSensor(SensorEntity, BarcoEntity):
     """Sensor class."""
 
+    entity_description: BarcoSensorEntityDescription
+
+    @property
+    def device_keys(self) -> tuple[str, ...]:
+        """Device properties this entity depends on."""
+        return (self.entity_description.device_key,)
+
     @property
     def available(self) -> bool:
         """Return online state."""
-        dev_sensor = BARCO_SENSOR_MAP[self.entity_description.key]
+        dev_sensor = self.entity_description.device_key
         return self.coordinator.device.get_sensor_value(dev_sensor) is not None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        dev_sensor = BARCO_SENSOR_MAP[self.entity_description.key]
+        dev_sensor = self.entity_description.device_key
         self._attr_native_value = self.coordinator.device.get_sensor_value(dev_sensor)
         self.async_write_ha_state()
+
+class BarcoStatsSensor(SensorEntity, BarcoEntity):
+    """Link statistics sensor, disabled by default.
+
+    The counters change on every message, so these sensors are polled
+    rather than woken by the device.
+    """
+
+    entity_description: BarcoStatsSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll the statistics."""
+        return True
+
+    @property
+    def available(self) -> bool:
+        """Statistics are always available."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the statistics."""
+        self._attr_native_value = self.entity_description.value_fn(self.device.stats)
@@ -0,0 +1,154 @@
+"""Projector state store for Barco Pulse devices."""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+_MISSING: Any = object()
+
+
+class StateSnapshot(Mapping[str, Any]):
+    """Immutable view of the store at one version.
+
+    Snapshots share the key table with the store and with each other, and
+    only hold their own tuple of values.
+    """
+
+    __slots__ = ("_index", "_keys", "_values", "_version")
+
+    def __init__(
+        self, index: dict[str, int], keys: tuple[str, ...], values: tuple, version: int
+    ) -> None:
+        """Set up snapshot."""
+        self._index = index
+        self._keys = keys
+        self._values = values
+        self._version = version
+
+    @property
+    def version(self) -> int:
+        """Store version the snapshot was taken at."""
+        return self._version
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._index.get(key)
+        if i is None or i >= len(self._values) or (value := self._values[i]) is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key, value in zip(self._keys, self._values):
+            if value is not _MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(value is not _MISSING for value in self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StateSnapshot) and self._index is other._index:
+            # Same store: equal versions mean nothing changed in between
+            if self._version == other._version:
+                return True
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(version={self._version}, {dict(self)!r})"
+
+
+class StateStore:
+    """Projector properties kept in fixed slots, each with the version it last changed at.
+
+    Every change bumps the store version.  A snapshot is only built once
+    per version, and the keys changed since any earlier version can be
+    listed without looking at unchanged keys.
+    """
+
+    __slots__ = ("_index", "_keys", "_values", "_versions", "_version", "_log", "_snapshot")
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        """Set up store with slots for the known keys."""
+        self._index: dict[str, int] = {}
+        self._keys: tuple[str, ...] = ()
+        self._values: list[Any] = []
+        self._versions = array("Q")
+        self._version = 0
+        # Keys ordered by the version they last changed at, oldest first
+        self._log: dict[str, int] = {}
+        self._snapshot: StateSnapshot | None = None
+        for key in keys:
+            self._slot(key)
+
+    def _slot(self, key: str) -> int:
+        """Index of key, adding a slot for a key not seen before."""
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = len(self._values)
+            self._keys += (key,)
+            self._values.append(_MISSING)
+            self._versions.append(0)
+        return i
+
+    @property
+    def version(self) -> int:
+        """Version of the latest change."""
+        return self._version
+
+    def key_version(self, key: str) -> int:
+        """Version at which key last changed, 0 if never."""
+        i = self._index.get(key)
+        return 0 if i is None else self._versions[i]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Current value of key."""
+        i = self._index.get(key)
+        if i is None or (value := self._values[i]) is _MISSING:
+            return default
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        i = self._index.get(key)
+        return i is not None and self._values[i] is not _MISSING
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store a value, returning True if it changed."""
+        i = self._slot(key)
+        old = self._values[i]
+        if old is not _MISSING and old == value:
+            return False
+        self._values[i] = value
+        self._touch(i, key)
+        return True
+
+    def clear(self, keep: Iterable[str] = ()) -> None:
+        """Forget every value except those of keep."""
+        keep = set(keep)
+        for i, key in enumerate(self._keys):
+            if key not in keep and self._values[i] is not _MISSING:
+                self._values[i] = _MISSING
+                self._touch(i, key)
+
+    def _touch(self, i: int, key: str) -> None:
+        self._version += 1
+        self._versions[i] = self._version
+        self._log.pop(key, None)
+        self._log[key] = self._version
+
+    def changed_since(self, version: int) -> list[str]:
+        """Keys changed after version, newest first."""
+        changed = []
+        for key in reversed(self._log):
+            if self._log[key] <= version:
+                break
+            changed.append(key)
+        return changed
+
+    def snapshot(self) -> StateSnapshot:
+        """Immutable view of the current values."""
+        snap = self._snapshot
+        if snap is None or snap.version != self._version or len(snap._keys) != len(self._keys):
+            snap = self._snapshot = StateSnapshot(
+                self._index, self._keys, tuple(self._values), self._version
+            )
+        return snap
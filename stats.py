@@ -0,0 +1,208 @@
+"""Link statistics for Barco Pulse devices."""
+
+from bisect import bisect_left
+from collections import Counter, deque
+import time
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000
+)
+
+# Number of recent disconnects remembered with their reason
+MAX_RECENT_DISCONNECTS = 20
+
+# Handshake phases, timed separately
+PHASE_CONNECT = "connect"  # TCP connection
+PHASE_PROBE = "probe"  # model, serial number and state
+PHASE_SUBSCRIBE = "subscribe"  # authenticate, subscribe and initial read
+PHASE_TOTAL = "total"
+
+# Power-on milestones, timed from the turn on request
+POWER_WOL_SENT = "wol_sent"  # first wake-on-lan packet out
+POWER_REACHABLE = "reachable"  # control port answered with the projector out of eco
+POWER_ONLINE = "online"  # handshake done
+POWER_COMMAND = "poweron"  # poweron acknowledged
+POWER_LIT = "lit"  # system state reached on
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Set up histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of all samples."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, pct: float) -> float | None:
+        """Upper bound of the bucket holding the given percentile, capped at the maximum."""
+        if not self.count:
+            return None
+        rank = self.count * pct / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Histogram as plain data."""
+        buckets = {f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": self.max,
+            "buckets": buckets,
+        }
+
+
+class DeviceStats:
+    """Counters kept for one device.
+
+    Everything is updated inline with plain integer and float arithmetic,
+    so the counters stay on in production.
+    """
+
+    def __init__(self) -> None:
+        """Set up counters."""
+        self.started = time.monotonic()
+        self.rtt: dict[str, LatencyHistogram] = {}
+        self.timeouts: Counter[str] = Counter()
+        self.notifications: Counter[str] = Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.connects = 0
+        self.connect_failures: Counter[str] = Counter()
+        self.disconnects: Counter[str] = Counter()
+        self.recent_disconnects: deque[tuple[float, str]] = deque(maxlen=MAX_RECENT_DISCONNECTS)
+        self.max_pending = 0
+        self.update_time = LatencyHistogram()
+        self.heartbeat_rtt = LatencyHistogram()
+        self.missed_heartbeats = 0
+        self.coalesced_writes = 0
+        self.handshake: dict[str, LatencyHistogram] = {}
+        self.last_handshake: float | None = None
+        self.setup_time: float | None = None
+        self.first_online: float | None = None
+        self.power_on: dict[str, LatencyHistogram] = {}
+        self.last_power_on: dict[str, float] = {}
+
+    def record_rtt(self, method: str, seconds: float) -> None:
+        """Record the round trip time of a request."""
+        hist = self.rtt.get(method)
+        if hist is None:
+            hist = self.rtt[method] = LatencyHistogram()
+        hist.add(seconds * 1000)
+
+    def record_phase(self, phase: str, seconds: float) -> None:
+        """Record how long a handshake phase took."""
+        hist = self.handshake.get(phase)
+        if hist is None:
+            hist = self.handshake[phase] = LatencyHistogram()
+        hist.add(seconds * 1000)
+        if phase == PHASE_TOTAL:
+            self.last_handshake = seconds * 1000
+            if self.first_online is None:
+                self.first_online = time.monotonic() - self.started
+
+    def record_power_on(self, milestone: str, seconds: float) -> None:
+        """Record how long after a turn on request a milestone was reached."""
+        hist = self.power_on.get(milestone)
+        if hist is None:
+            hist = self.power_on[milestone] = LatencyHistogram()
+        hist.add(seconds * 1000)
+        self.last_power_on[milestone] = seconds * 1000
+
+    @property
+    def click_to_light(self) -> float | None:
+        """Time from the last turn on request to the projector being on, in milliseconds."""
+        return self.last_power_on.get(POWER_LIT)
+
+    def record_pending(self, depth: int) -> None:
+        """Record the pending request table size."""
+        if depth > self.max_pending:
+            self.max_pending = depth
+
+    def record_disconnect(self, reason: str) -> None:
+        """Record a lost connection."""
+        self.disconnects[reason] += 1
+        self.recent_disconnects.append((time.time(), reason))
+
+    @property
+    def reconnects(self) -> int:
+        """Number of connections after the first."""
+        return max(self.connects - 1, 0)
+
+    @property
+    def notification_total(self) -> int:
+        """Number of property notifications received."""
+        return sum(self.notifications.values())
+
+    @property
+    def notification_rate(self) -> float:
+        """Average property notifications per minute."""
+        elapsed = time.monotonic() - self.started
+        return self.notification_total * 60 / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def rtt_mean(self) -> float | None:
+        """Mean round trip time over all methods, in milliseconds."""
+        count = sum(h.count for h in self.rtt.values())
+        return sum(h.total for h in self.rtt.values()) / count if count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Statistics as plain data."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "uptime_s": elapsed,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "connect_failures": dict(self.connect_failures),
+            "disconnects": dict(self.disconnects),
+            "recent_disconnects": [
+                {"time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(t)), "reason": r}
+                for t, r in self.recent_disconnects
+            ],
+            "max_pending_requests": self.max_pending,
+            "rtt": {method: hist.as_dict() for method, hist in self.rtt.items()},
+            "timeouts": dict(self.timeouts),
+            "notifications": {
+                prop: {"count": count, "per_minute": count * 60 / elapsed}
+                for prop, count in self.notifications.items()
+            },
+            "property_update_time": self.update_time.as_dict(),
+            "heartbeat_rtt": self.heartbeat_rtt.as_dict(),
+            "missed_heartbeats": self.missed_heartbeats,
+            "coalesced_writes": self.coalesced_writes,
+            "setup_ms": self.setup_time,
+            "first_online_s": self.first_online,
+            "handshake": {phase: hist.as_dict() for phase, hist in self.handshake.items()},
+            "power_on": {
+                milestone: hist.as_dict() for milestone, hist in self.power_on.items()
+            },
+            "last_power_on_ms": self.last_power_on,
+        }
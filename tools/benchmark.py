@@ -0,0 +1,264 @@
+"""Benchmarks for the Barco Pulse integration's hot paths.
+
+Runs the real BarcoDevice against the local Pulse simulator and writes
+the results as JSON, so runs can be compared for regressions:
+
+* framing, decoding and validate_response, in messages per second
+* property_update, in updates per second
+* listener throughput for canned notification bursts (1 to 10k)
+* end-to-end latency from a property.changed message being written to
+  the socket until the device wakes the entity listening for that key
+* connect-to-subscribed time of the connection supervisor
+
+Needs Home Assistant installed, since the device code imports it.  A
+minimal stand-in for the hass object is used instead of a running
+instance, so entity state writes themselves are not included.
+
+    python tools/benchmark.py --output bench_output.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import importlib
+import json
+import logging
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+import types
+from typing import Any
+
+from pulse_simulator import Faults, PulseSimulator
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+_pkg = ROOT.name
+device_mod = importlib.import_module(f"{_pkg}.device")
+hub_mod = importlib.import_module(f"{_pkg}.hub")
+protocol_mod = importlib.import_module(f"{_pkg}.protocol")
+const_mod = importlib.import_module(f"{_pkg}.const")
+properties_mod = importlib.import_module(f"{_pkg}.properties")
+
+BURSTS = (1, 10, 100, 1000, 10000)
+PIN = 1234
+MAC = "00:11:22:33:44:55"
+TEMP = properties_mod.DEVICE_INLET_T
+
+
+def _hass(loop: asyncio.AbstractEventLoop) -> Any:
+    """Just enough of HomeAssistant for BarcoDevice and BarcoHub."""
+    return types.SimpleNamespace(
+        loop=loop,
+        data={},
+        async_create_background_task=lambda coro, name, eager_start=True: loop.create_task(
+            coro, name=name
+        ),
+        async_add_executor_job=lambda func, *args: loop.run_in_executor(None, func, *args),
+    )
+
+
+def _notification(value: float) -> bytes:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": "property.changed", "params": {"property": [{TEMP: value}]}}
+    ).encode()
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Latency summary in milliseconds."""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "samples": len(ms),
+        "mean_ms": statistics.fmean(ms),
+        "median_ms": statistics.median(ms),
+        "p95_ms": ms[int(len(ms) * 0.95) - 1] if len(ms) >= 20 else ms[-1],
+        "p99_ms": ms[int(len(ms) * 0.99) - 1] if len(ms) >= 100 else ms[-1],
+        "max_ms": ms[-1],
+    }
+
+
+def _rate(count: int, func: Callable[[], None], repeat: int) -> float:
+    """Best items per second over repeat runs of func."""
+    best = min(_timed(func) for _ in range(repeat))
+    return count / best
+
+
+def _timed(func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_decode(device, count: int, repeat: int) -> dict[str, float]:
+    """Framing, decoding and validate_response, without the socket."""
+    stream = b"".join(_notification(20 + i / 100) for i in range(count))
+    chunks = [stream[i : i + 65536] for i in range(0, len(stream), 65536)]
+
+    def run() -> None:
+        framer = protocol_mod.JsonRpcFramer()
+        for chunk in chunks:
+            for msg in framer.decode(chunk):
+                device.validate_response(msg)
+
+    return {
+        "messages": count,
+        "bytes": len(stream),
+        "msgs_per_s": _rate(count, run, repeat),
+    }
+
+
+def bench_property_update(device, count: int, repeat: int) -> dict[str, float]:
+    """property_update with a value that changes every call."""
+    updates = [{TEMP: 20 + i / 100} for i in range(count)]
+
+    def run() -> None:
+        for update in updates:
+            device.property_update(update)
+
+    return {"updates": count, "updates_per_s": _rate(count, run, repeat)}
+
+
+async def _connected_device(hass, hub, dispatch_window: float):
+    """Create a device and wait until it is subscribed."""
+    device = device_mod.BarcoDevice(
+        hass, hub, "127.0.0.1", MAC, str(PIN), dispatch_window=dispatch_window
+    )
+    # The notifications move by hundredths of a degree, which the filter would drop
+    device.set_filter_options(0, 0, 0)
+    online = asyncio.Event()
+    device.async_add_key_listener(
+        (device_mod.DEVICE_ONLINE,), lambda: online.set() if device.online else None
+    )
+    start = time.perf_counter()
+    await device.async_init(lambda changed: None)
+    await asyncio.wait_for(online.wait(), 30)
+    return device, time.perf_counter() - start
+
+
+async def bench_connect(hass, hub, sim: PulseSimulator, repeat: int) -> dict[str, float]:
+    """Time from starting the supervisor until the device is subscribed."""
+    samples = []
+    for _ in range(repeat):
+        device, elapsed = await _connected_device(hass, hub, 0)
+        samples.append(elapsed)
+        await device.async_shutdown()
+    return _summary(samples)
+
+
+async def bench_bursts(hass, hub, sim: PulseSimulator, repeat: int) -> dict[str, Any]:
+    """Listener throughput for canned bursts written in one go."""
+    device, _ = await _connected_device(hass, hub, device_mod.BARCO_DISPATCH_WINDOW)
+    handled = 0
+    done = asyncio.Event()
+    target = 0
+    update = device.property_update
+
+    def counting_update(updates) -> None:
+        nonlocal handled
+        update(updates)
+        handled += 1
+        if handled >= target:
+            done.set()
+
+    device.property_update = counting_update
+    results = {}
+    base = 0
+    try:
+        for size in BURSTS:
+            best = None
+            for _ in range(repeat):
+                data = b"".join(_notification(base + i / 100) for i in range(size))
+                base += 1000
+                handled = 0
+                target = size
+                done.clear()
+                start = time.perf_counter()
+                sim.inject(data)
+                await asyncio.wait_for(done.wait(), 60)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results[str(size)] = {"seconds": best, "msgs_per_s": size / best}
+    finally:
+        await device.async_shutdown()
+    return results
+
+
+async def bench_latency(
+    hass, hub, sim: PulseSimulator, samples: int, dispatch_window: float
+) -> dict[str, float]:
+    """Time from writing one notification to the key listener running."""
+    device, _ = await _connected_device(hass, hub, dispatch_window)
+    woken = asyncio.Event()
+    device.async_add_key_listener((TEMP,), woken.set)
+    latencies = []
+    try:
+        for i in range(samples):
+            woken.clear()
+            start = time.perf_counter()
+            sim.inject(_notification(30 + i / 100))
+            await asyncio.wait_for(woken.wait(), 10)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await device.async_shutdown()
+    result = _summary(latencies)
+    result["dispatch_window_s"] = dispatch_window
+    return result
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every benchmark."""
+    loop = asyncio.get_running_loop()
+    hass = _hass(loop)
+    hub = hub_mod.BarcoHub(hass)
+    sim = PulseSimulator(
+        port=const_mod.BARCO_PORT, pin=PIN, state="on", faults=Faults(), temperature_interval=0
+    )
+    await sim.start()
+    offline = device_mod.BarcoDevice(hass, hub, "127.0.0.1", MAC, str(PIN), dispatch_window=3600)
+    offline.set_filter_options(0, 0, 0)
+    try:
+        results = {
+            "decode": bench_decode(offline, args.messages, args.repeat),
+            "property_update": bench_property_update(offline, args.messages, args.repeat),
+            "connect": await bench_connect(hass, hub, sim, args.repeat),
+            "bursts": await bench_bursts(hass, hub, sim, args.repeat),
+            "latency": await bench_latency(hass, hub, sim, args.samples, 0),
+            "latency_coalesced": await bench_latency(
+                hass, hub, sim, min(args.samples, 50), device_mod.BARCO_DISPATCH_WINDOW
+            ),
+        }
+    finally:
+        await sim.stop()
+        hub.close()
+    return results
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    results = asyncio.run(run(args))
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": vars(args),
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+"""Stand-alone simulator of the Barco Pulse JSON-RPC API.
+
+Runs a TCP server that behaves like a projector on port 9090 closely
+enough to exercise the integration without hardware:
+
+* system.state walks eco -> boot -> ready -> conditioning -> on and back
+* property.get / property.set / property.subscribe with property.changed
+  pushes, including JSON-RPC batches
+* image.source.list, authenticate and the system.* power methods
+* an optional UDP wake-on-lan listener that wakes the projector from eco
+
+Faults can be injected to reproduce bad networks and busy projectors:
+fragmented or coalesced TCP writes, reply latency, dropped replies,
+half-open sockets and notification floods.
+
+    python tools/pulse_simulator.py --port 9090 --state eco --wol-port 9
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import random
+from typing import Any
+
+_LOGGER = logging.getLogger("pulse_simulator")
+
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+NOT_AUTHORIZED = -32001
+
+READY_STATES = ("ready", "conditioning", "on", "deconditioning")
+
+DEFAULT_PROPERTIES: dict[str, Any] = {
+    "system.modelname": "F80-4K9",
+    "system.serialnumber": "2590000000",
+    "system.firmwareversion": "1.12.3",
+    "system.state": "on",
+    "system.targetstate": "on",
+    "environment.temperature.inlet.value": 24.0,
+    "environment.temperature.outlet.value": 31.0,
+    "environment.temperature.mainboard.value": 42.0,
+    "illumination.state": "On",
+    "illumination.sources.laser.status": "On",
+    "illumination.sources.laser.power": 80.0,
+    "image.connector.hdmi.detectedsignal": {"active": True, "name": "3840x2160 @ 60Hz"},
+    "image.resolution.processing.size": {"pixels": 3840, "lines": 2160},
+    "image.window.main.source": "HDMI",
+}
+
+SOURCES = ["HDMI", "DisplayPort 1", "DisplayPort 2", "SDI", "HDBaseT"]
+
+TEMPERATURES = (
+    "environment.temperature.inlet.value",
+    "environment.temperature.outlet.value",
+    "environment.temperature.mainboard.value",
+)
+
+
+@dataclass
+class Faults:
+    """Fault injection settings."""
+
+    latency: float = 0.0  # seconds before each reply
+    drop_rate: float = 0.0  # fraction of replies never sent
+    fragment: bool = False  # split every write into small random chunks
+    coalesce: float = 0.0  # hold writes for this long and send them together
+    half_open_after: float | None = None  # go silent this long after connect
+    flood_rate: float = 0.0  # extra property.changed notifications per second
+
+
+class PulseSimulator:
+    """Simulated projector."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9090,
+        pin: int | None = None,
+        state: str = "on",
+        faults: Faults | None = None,
+        boot_time: float = 2.0,
+        conditioning_time: float = 3.0,
+        temperature_interval: float = 5.0,
+        wol_port: int | None = None,
+    ) -> None:
+        """Set up simulator."""
+        self.host = host
+        self.port = port
+        self.pin = pin
+        self.faults = faults or Faults()
+        self.boot_time = boot_time
+        self.conditioning_time = conditioning_time
+        self.temperature_interval = temperature_interval
+        self.wol_port = wol_port
+        self.properties = dict(DEFAULT_PROPERTIES)
+        self.sessions: set[_Session] = set()
+        self.requests_handled = 0
+        self._server: asyncio.Server | None = None
+        self._wol_transport: asyncio.DatagramTransport | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._transition: asyncio.Task | None = None
+        self._set_power_state(state)
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.wol_port is not None:
+            loop = asyncio.get_running_loop()
+            self._wol_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _WolProtocol(self), local_addr=("0.0.0.0", self.wol_port)
+            )
+        if self.temperature_interval > 0:
+            self._spawn(self._temperature_drift())
+        if self.faults.flood_rate > 0:
+            self._spawn(self._flood())
+        _LOGGER.info("Simulating Pulse projector on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop listening and drop every connection."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._transition is not None:
+            self._transition.cancel()
+        if self._wol_transport is not None:
+            self._wol_transport.close()
+        if self._server is not None:
+            self._server.close()
+        for session in list(self.sessions):
+            session.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def drop_connections(self) -> None:
+        """Close every client connection, as a projector reboot would."""
+        for session in list(self.sessions):
+            session.close()
+
+    def inject(self, data: bytes) -> None:
+        """Write raw bytes to every client, bypassing encoding and faults."""
+        for session in self.sessions:
+            session.writer.write(data)
+
+    def set_property(self, name: str, value: Any) -> None:
+        """Change a property and notify subscribers."""
+        if self.properties.get(name) == value:
+            return
+        self.properties[name] = value
+        for session in self.sessions:
+            session.notify(name, value)
+
+    def notify_burst(self, count: int, name: str = TEMPERATURES[0]) -> None:
+        """Push count notifications for one property back to back."""
+        base = self.properties.get(name, 0)
+        for i in range(count):
+            self.set_property(name, base + (i + 1) / 100)
+
+    def wake(self) -> None:
+        """Handle a wake-on-lan packet."""
+        if self.properties["system.state"] == "eco":
+            _LOGGER.info("Woken from eco")
+            self._start_transition(("boot", self.boot_time), ("ready", 0))
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _set_power_state(self, state: str) -> None:
+        self.set_property("system.state", state)
+        self.set_property("system.targetstate", state)
+        lit = "On" if state == "on" else "Off"
+        self.set_property("illumination.state", lit)
+        self.set_property("illumination.sources.laser.status", lit)
+
+    def _start_transition(self, *steps: tuple[str, float], target: str | None = None) -> None:
+        """Walk through states, spending the given time in each."""
+        if self._transition is not None:
+            self._transition.cancel()
+        if target is not None:
+            self.set_property("system.targetstate", target)
+        self._transition = asyncio.create_task(self._run_transition(steps))
+
+    async def _run_transition(self, steps: tuple[tuple[str, float], ...]) -> None:
+        for state, duration in steps:
+            self.set_property("system.state", state)
+            await asyncio.sleep(duration)
+        self._set_power_state(steps[-1][0])
+
+    async def _temperature_drift(self) -> None:
+        while True:
+            await asyncio.sleep(self.temperature_interval)
+            for name in TEMPERATURES:
+                value = self.properties[name] + random.uniform(-0.3, 0.3)
+                self.set_property(name, round(value, 1))
+
+    async def _flood(self) -> None:
+        interval = 1 / self.faults.flood_rate
+        name = TEMPERATURES[0]
+        while True:
+            await asyncio.sleep(interval)
+            self.set_property(name, round(self.properties[name] + 0.01, 2))
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = _Session(self, reader, writer)
+        self.sessions.add(session)
+        try:
+            await session.run()
+        finally:
+            self.sessions.discard(session)
+            session.close()
+
+    def call(self, session: _Session, method: str, params: Any) -> Any:
+        """Run one request, raising _RpcError on failure."""
+        self.requests_handled += 1
+        state = self.properties["system.state"]
+        if method == "authenticate":
+            code = params.get("code") if isinstance(params, dict) else None
+            if self.pin is not None and code != self.pin:
+                raise _RpcError(NOT_AUTHORIZED, "Invalid code")
+            session.authenticated = True
+            return True
+        if method == "property.get":
+            names = _names(params)
+            return {n: self.properties.get(n) for n in names}
+        if method == "property.set":
+            if not isinstance(params, dict) or "property" not in params:
+                raise _RpcError(INVALID_PARAMS, "Missing property")
+            if params["property"] == "image.window.main.source" and params["value"] not in SOURCES:
+                raise _RpcError(INVALID_PARAMS, "Unknown source")
+            self.set_property(params["property"], params.get("value"))
+            return True
+        if method == "property.subscribe":
+            session.subscriptions.update(_names(params))
+            return True
+        if method == "property.unsubscribe":
+            session.subscriptions.difference_update(_names(params))
+            return True
+        if method == "image.source.list":
+            return list(SOURCES)
+        if method == "system.poweron":
+            if state not in READY_STATES:
+                raise _RpcError(INVALID_PARAMS, f"Cannot power on from {state}")
+            self._start_transition(
+                ("conditioning", self.conditioning_time), ("on", 0), target="on"
+            )
+            return True
+        if method == "system.poweroff":
+            self._start_transition(
+                ("deconditioning", self.conditioning_time), ("ready", 0), target="ready"
+            )
+            return True
+        if method == "system.gotoready":
+            if state == "eco":
+                self._start_transition(("boot", self.boot_time), ("ready", 0), target="ready")
+            return True
+        if method == "system.gotoeco":
+            self._start_transition(("eco", 0), target="eco")
+            return True
+        if method.startswith(("key.", "system.")):
+            return True
+        raise _RpcError(METHOD_NOT_FOUND, f"Unknown method {method}")
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _names(params: Any) -> list[str]:
+    if isinstance(params, dict):
+        names = params.get("property", [])
+    else:
+        names = params
+    return [names] if isinstance(names, str) else list(names or [])
+
+
+class _Session:
+    """One client connection."""
+
+    def __init__(
+        self, sim: PulseSimulator, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.sim = sim
+        self.reader = reader
+        self.writer = writer
+        self.faults = sim.faults
+        self.subscriptions: set[str] = set()
+        self.authenticated = False
+        self.silent = False
+        self._outbox: list[bytes] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._writes: asyncio.Queue[bytes] = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.faults.half_open_after is not None:
+            loop.call_later(self.faults.half_open_after, self._go_silent)
+        decoder = json.JSONDecoder()
+        buf = ""
+        while True:
+            data = await self.reader.read(65536)
+            if not data:
+                return
+            if self.silent:
+                continue
+            buf += data.decode("utf-8", "replace")
+            while True:
+                buf = buf.lstrip()
+                if not buf:
+                    break
+                try:
+                    obj, end = decoder.raw_decode(buf)
+                except json.JSONDecodeError:
+                    if buf[0] not in "{[":
+                        self._send({"jsonrpc": "2.0", "id": None,
+                                    "error": {"code": PARSE_ERROR, "message": "Parse error"}})
+                        buf = ""
+                    break
+                buf = buf[end:]
+                self._handle(obj)
+
+    def _handle(self, obj: Any) -> None:
+        batch = isinstance(obj, list)
+        replies = [r for r in map(self._call, obj if batch else [obj]) if r is not None]
+        if not replies or random.random() < self.faults.drop_rate:
+            return
+        reply = replies if batch else replies[0]
+        if self.faults.latency > 0:
+            asyncio.get_running_loop().call_later(self.faults.latency, self._send, reply)
+        else:
+            self._send(reply)
+
+    def _call(self, req: Any) -> dict | None:
+        if not isinstance(req, dict) or "method" not in req:
+            return {"jsonrpc": "2.0", "id": None,
+                    "error": {"code": PARSE_ERROR, "message": "Invalid request"}}
+        try:
+            result = self.sim.call(self, req["method"], req.get("params"))
+        except _RpcError as err:
+            reply = {"jsonrpc": "2.0", "error": {"code": err.code, "message": err.message}}
+        else:
+            reply = {"jsonrpc": "2.0", "result": result}
+        if "id" not in req:
+            return None
+        reply["id"] = req["id"]
+        return reply
+
+    def notify(self, name: str, value: Any) -> None:
+        if name in self.subscriptions:
+            self._send({"jsonrpc": "2.0", "method": "property.changed",
+                        "params": {"property": [{name: value}]}})
+
+    def _go_silent(self) -> None:
+        _LOGGER.info("Session going half-open")
+        self.silent = True
+
+    def _send(self, msg: Any) -> None:
+        if self.silent or self.writer.is_closing():
+            return
+        self._outbox.append(json.dumps(msg).encode())
+        if self.faults.coalesce > 0:
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.faults.coalesce, self._flush
+                )
+        else:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        data = b"".join(self._outbox)
+        self._outbox.clear()
+        if self.faults.fragment:
+            self._writes.put_nowait(data)
+        else:
+            self.writer.write(data)
+
+    async def _write_loop(self) -> None:
+        """Dribble fragmented writes out in small pieces."""
+        while True:
+            data = await self._writes.get()
+            while data:
+                size = random.randint(1, 64)
+                self.writer.write(data[:size])
+                data = data[size:]
+                await self.writer.drain()
+                await asyncio.sleep(random.uniform(0, 0.002))
+
+    def close(self) -> None:
+        self._writer_task.cancel()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self.writer.close()
+
+
+class _WolProtocol(asyncio.DatagramProtocol):
+    """Wake the simulator on any magic packet."""
+
+    def __init__(self, sim: PulseSimulator) -> None:
+        self.sim = sim
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if len(data) >= 102 and data[:6] == b"\xff" * 6:
+            self.sim.wake()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    faults = Faults(
+        latency=args.latency,
+        drop_rate=args.drop_rate,
+        fragment=args.fragment,
+        coalesce=args.coalesce,
+        half_open_after=args.half_open_after,
+        flood_rate=args.flood_rate,
+    )
+    sim = PulseSimulator(
+        host=args.host,
+        port=args.port,
+        pin=args.pin,
+        state=args.state,
+        faults=faults,
+        boot_time=args.boot_time,
+        conditioning_time=args.conditioning_time,
+        temperature_interval=args.temperature_interval,
+        wol_port=args.wol_port,
+    )
+    await sim.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await sim.stop()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9090)
+    parser.add_argument("--pin", type=int, default=None, help="require this authentication code")
+    parser.add_argument("--state", default="on", choices=("eco", "ready", "on"))
+    parser.add_argument("--wol-port", type=int, default=None, help="listen for magic packets")
+    parser.add_argument("--boot-time", type=float, default=2.0)
+    parser.add_argument("--conditioning-time", type=float, default=3.0)
+    parser.add_argument("--temperature-interval", type=float, default=5.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--fragment", action="store_true")
+    parser.add_argument("--coalesce", type=float, default=0.0)
+    parser.add_argument("--half-open-after", type=float, default=None)
+    parser.add_argument("--flood-rate", type=float, default=0.0)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()